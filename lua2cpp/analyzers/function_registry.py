@@ -11,7 +11,7 @@ Architecture:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 if __name__.startswith('lua2cpp.analyzers'):
     # When imported from within lua2cpp package
@@ -23,13 +23,13 @@ else:
         from ..core.types import Type, TableTypeInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class CallSiteInfo:
     """Information about a specific function call site
 
     Stores details about where a function is called and what arguments
     are passed, enabling type propagation from arguments to parameters
-    and vice versa.
+    and vice versa. Slotted, since one is recorded per call expression.
 
     Attributes:
         caller_name: Name of the function making this call
@@ -64,17 +64,25 @@ class FunctionSignature:
     Attributes:
         name: Function name
         param_names: Ordered list of parameter names
-        param_table_info: Mapping from parameter index to table type info
+        param_table_info: Table type info per parameter index (None if unknown),
+            sized to param_names so lookups are a plain list index
         return_type: Inferred return type (None if unknown)
         is_local: True if this is a local function
         call_sites: List of all call sites for this function
+        is_empty: True if the function body has no statements
     """
     name: str
     param_names: List[str]
-    param_table_info: Dict[int, 'TableTypeInfo'] = field(default_factory=dict)
+    param_table_info: List[Optional['TableTypeInfo']] = field(default_factory=list)
     return_type: Optional['Type'] = None
     is_local: bool = False
     call_sites: List[CallSiteInfo] = field(default_factory=list)
+    is_empty: bool = False
+
+    def __post_init__(self) -> None:
+        missing = len(self.param_names) - len(self.param_table_info)
+        if missing > 0:
+            self.param_table_info.extend([None] * missing)
 
     def get_param_index(self, param_name: str) -> Optional[int]:
         """Get the index of a parameter by name
@@ -107,7 +115,16 @@ class FunctionSignature:
         Returns:
             True if parameter has table type info
         """
-        return param_index in self.param_table_info
+        return (0 <= param_index < len(self.param_table_info) and
+                self.param_table_info[param_index] is not None)
+
+    def get_typed_param_indices(self) -> List[int]:
+        """Get indices of parameters that have type information
+
+        Returns:
+            List of parameter indices with table type info
+        """
+        return [i for i, info in enumerate(self.param_table_info) if info is not None]
 
     def get_all_call_sites(self) -> List[CallSiteInfo]:
         """Get all call sites for this function
@@ -133,7 +150,7 @@ class FunctionSignatureRegistry:
 
         # Update parameter type info
         from ..core.types import TableTypeInfo, Type, TypeKind
-        table_info = TableTypeInfo(is_array=True, value_type=Type(TypeKind.NUMBER))
+        table_info = TableTypeInfo(is_array=True, value_type=Type.of(TypeKind.NUMBER))
         registry.update_param_table_info("foo", 0, table_info)
 
         # Record a call site
@@ -147,6 +164,7 @@ class FunctionSignatureRegistry:
         """Initialize empty function registry"""
         self.signatures: Dict[str, FunctionSignature] = {}
         self.call_graph: Dict[str, List[str]] = {}  # func → list of callers
+        self._caller_sets: Dict[str, Set[str]] = {}  # func → callers, for O(1) dedup
 
     def register_function(
         self,
@@ -187,6 +205,40 @@ class FunctionSignatureRegistry:
 
         return signature
 
+    def register_many(
+        self,
+        specs: List[Tuple[str, List[str], bool]]
+    ) -> List[FunctionSignature]:
+        """Register several function signatures in one batch
+
+        Equivalent to calling register_function() for each spec in order,
+        but the signatures are inserted with a single dict update. Nothing
+        is registered if any spec is invalid.
+
+        Args:
+            specs: (name, param_names, is_local) tuples
+
+        Returns:
+            Created FunctionSignature objects, in spec order
+
+        Raises:
+            ValueError: If any param_names contains duplicates
+        """
+        for name, param_names, _ in specs:
+            if len(param_names) != len(set(param_names)):
+                raise ValueError(f"Function '{name}' has duplicate parameter names")
+
+        created = [
+            FunctionSignature(name=name, param_names=param_names, is_local=is_local)
+            for name, param_names, is_local in specs
+        ]
+        self.signatures.update((signature.name, signature) for signature in created)
+
+        for signature in created:
+            self.call_graph.setdefault(signature.name, [])
+
+        return created
+
     def has_function(self, name: str) -> bool:
         """Check if a function is registered
 
@@ -233,7 +285,7 @@ class FunctionSignatureRegistry:
         if not signature:
             return False
 
-        if param_index < 0 or param_index >= len(signature.param_names):
+        if param_index < 0 or param_index >= len(signature.param_table_info):
             return False
 
         signature.param_table_info[param_index] = table_info
@@ -257,7 +309,9 @@ class FunctionSignatureRegistry:
         if not signature:
             return None
 
-        return signature.param_table_info.get(param_index)
+        if 0 <= param_index < len(signature.param_table_info):
+            return signature.param_table_info[param_index]
+        return None
 
     def get_param_name(self, func_name: str, param_index: int) -> Optional[str]:
         """Get the name of a parameter by index
@@ -312,10 +366,10 @@ class FunctionSignatureRegistry:
         callee_sig.call_sites.append(call_site)
 
         # Update call graph
-        if callee not in self.call_graph:
-            self.call_graph[callee] = []
-        if caller not in self.call_graph[callee]:
-            self.call_graph[callee].append(caller)
+        callers = self._caller_sets.setdefault(callee, set())
+        if caller not in callers:
+            callers.add(caller)
+            self.call_graph.setdefault(callee, []).append(caller)
 
     def get_call_sites_for_function(self, func_name: str) -> List[CallSiteInfo]:
         """Get all call sites for a specific function
@@ -359,7 +413,7 @@ class FunctionSignatureRegistry:
         """
         result = []
         for name, sig in self.signatures.items():
-            if sig.param_table_info:
+            if any(info is not None for info in sig.param_table_info):
                 result.append(name)
         return result
 
@@ -369,11 +423,13 @@ class FunctionSignatureRegistry:
         Returns:
             Dictionary with statistics about registered functions
         """
-        total_params = sum(len(sig.param_names) for sig in self.signatures.values())
-        typed_params = sum(
-            len(sig.param_table_info) for sig in self.signatures.values()
-        )
-        total_calls = sum(len(sig.call_sites) for sig in self.signatures.values())
+        # Single pass; signatures and call sites are mutated in place by
+        # callers, so running counters could not be trusted
+        total_params = typed_params = total_calls = 0
+        for sig in self.signatures.values():
+            total_params += len(sig.param_names)
+            typed_params += len(sig.param_table_info) - sig.param_table_info.count(None)
+            total_calls += len(sig.call_sites)
 
         return {
             "total_functions": len(self.signatures),
@@ -403,7 +459,7 @@ class FunctionSignatureRegistry:
             lines.append(f"\nFunctions with typed parameters ({len(typed_funcs)}):")
             for func_name in typed_funcs:
                 sig = self.signatures[func_name]
-                typed_indices = list(sig.param_table_info.keys())
+                typed_indices = sig.get_typed_param_indices()
                 lines.append(f"  {func_name}: params {typed_indices}")
 
         return "\n".join(lines)
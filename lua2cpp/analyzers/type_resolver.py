@@ -16,7 +16,7 @@ Design Principles:
 - Comprehensive call graph tracking
 """
 
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Set
 from luaparser import astnodes
 
 from ..core.scope import ScopeManager
@@ -51,6 +51,8 @@ class TypeResolver:
         self._current_function: Optional[str] = None
         self._max_iterations: int = 10
         self.inferred_types: Dict[str, Type] = {}
+        # Chunks already run through pass 2, keyed by id (value keeps the id alive)
+        self._inferred_chunks: Dict[int, astnodes.Chunk] = {}
 
     def resolve_chunk(self, chunk: astnodes.Chunk) -> None:
         """Perform multi-pass type resolution on entire chunk
@@ -79,13 +81,19 @@ class TypeResolver:
         Args:
             chunk: AST chunk to analyze
         """
+        specs = []
+        empty_bodies = []
         for stmt in chunk.body.body:
             if isinstance(stmt, astnodes.LocalFunction):
                 func_name = stmt.name.id if hasattr(stmt.name, 'id') else "anonymous"
                 param_names = [p.id for p in stmt.args if hasattr(p, 'id')]
-                self.function_registry.register_function(
-                    func_name, param_names, is_local=True
-                )
+                specs.append((func_name, param_names, True))
+                empty_bodies.append(not stmt.body.body)
+
+        if specs:
+            signatures = self.function_registry.register_many(specs)
+            for signature, is_empty in zip(signatures, empty_bodies):
+                signature.is_empty = is_empty
 
     def _infer_local_types(self, chunk: astnodes.Chunk) -> None:
         """Pass 2: Infer types within function bodies
@@ -93,12 +101,42 @@ class TypeResolver:
         Performs local type inference for all statements,
         tracking parameter usage patterns within each function.
 
+        Results are memoized per chunk: a chunk that was already inferred
+        is skipped until invalidate() is called.
+
         Args:
             chunk: AST chunk to analyze
         """
-        for stmt in chunk.body.body:
+        if id(chunk) in self._inferred_chunks:
+            return
+        self._inferred_chunks[id(chunk)] = chunk
+
+        # Iterative walk in source order: each frame is (statements, enclosing function)
+        outer_function = self._current_function
+        stack = [(iter(chunk.body.body), outer_function)]
+        while stack:
+            statements, function = stack[-1]
+            stmt = next(statements, None)
+            if stmt is None:
+                stack.pop()
+                continue
+
+            self._current_function = function
             self._infer_statement(stmt)
 
+            nested = self._nested_statements(stmt)
+            if nested:
+                stack.append((iter(nested), self._current_function))
+
+        self._current_function = outer_function
+
+    def invalidate(self) -> None:
+        """Forget memoized local inference so chunks are re-analyzed
+
+        Call after mutating an AST that was already passed to the resolver.
+        """
+        self._inferred_chunks.clear()
+
     def _propagate_types_interprocedurally(self) -> None:
         """Pass 3: Iterative type propagation until fixed point
 
@@ -106,27 +144,48 @@ class TypeResolver:
         - Arguments → Parameters: Types from call sites propagate to function params
         - Parameters → Arguments: Parameter types propagate back to arguments
 
-        Uses iterative fixed-point algorithm to handle cyclic dependencies.
+        Uses a worklist fixed-point algorithm to handle cyclic dependencies:
+        every function is processed in the first round, later rounds only
+        revisit functions whose call-site arguments changed type. Empty
+        functions without typed parameters never use their arguments, so
+        they are left out entirely.
         Stops when no changes occur or max iterations reached.
 
         Conflict Resolution:
         - Conflicting types are merged into ANY/VARIANT types
         - Most specific types are preferred (NUMBER > TABLE > UNKNOWN)
         """
-        changed = True
+        signatures = {
+            name: signature
+            for name, signature in self.function_registry.signatures.items()
+            if not signature.is_empty or signature.get_typed_param_indices()
+        }
+
+        # Functions whose call sites pass each symbol as an argument
+        functions_by_arg: Dict[str, Set[str]] = {}
+        for func_name, signature in signatures.items():
+            for call_site in signature.call_sites:
+                for arg_symbol_name in call_site.arg_symbols:
+                    if arg_symbol_name:
+                        functions_by_arg.setdefault(arg_symbol_name, set()).add(func_name)
+
+        pending = list(signatures)
         iteration = 0
 
-        while changed and iteration < self._max_iterations:
-            changed = False
+        while pending and iteration < self._max_iterations:
             iteration += 1
 
-            changed |= self._propagate_args_to_params()
-            changed |= self._propagate_params_to_args()
+            changed_args: Set[str] = set()
+            self._propagate_args_to_params(pending)
+            self._propagate_params_to_args(pending, changed_args)
 
-            if not changed and iteration < self._max_iterations:
-                break
+            dirty: Set[str] = set()
+            for arg_symbol_name in changed_args:
+                dirty |= functions_by_arg.get(arg_symbol_name, set())
+            # Keep registry order so results do not depend on set ordering
+            pending = [name for name in signatures if name in dirty]
 
-    def _propagate_args_to_params(self) -> bool:
+    def _propagate_args_to_params(self, func_names: Optional[Iterable[str]] = None) -> bool:
         """Propagate types from arguments to parameters
 
         For each function call, examines the types of arguments
@@ -134,13 +193,21 @@ class TypeResolver:
         This enables type inference even when parameters are only
         used without explicit type assignments.
 
+        Args:
+            func_names: Functions to process (all registered functions if None)
+
         Returns:
             True if any changes were made, False otherwise
         """
         changed = False
         from ..core.types import TableTypeInfo
 
-        for func_name, signature in self.function_registry.signatures.items():
+        signatures = self.function_registry.signatures
+        if func_names is None:
+            func_names = list(signatures)
+
+        for func_name in func_names:
+            signature = signatures[func_name]
             for call_site in signature.call_sites:
                 # For each argument at this call site
                 for arg_idx, arg_symbol_name in enumerate(call_site.arg_symbols):
@@ -177,7 +244,7 @@ class TypeResolver:
                             merged_type = self._merge_types(
                                 param_table_info.value_type, arg_type
                             )
-                            if merged_type != param_table_info.value_type:
+                            if merged_type is not param_table_info.value_type:
                                 param_table_info.value_type = merged_type
                                 changed = True
                         else:
@@ -187,7 +254,11 @@ class TypeResolver:
 
         return changed
 
-    def _propagate_params_to_args(self) -> bool:
+    def _propagate_params_to_args(
+        self,
+        func_names: Optional[Iterable[str]] = None,
+        changed_args: Optional[Set[str]] = None
+    ) -> bool:
         """Propagate types from parameters back to arguments
 
         For each function with typed parameters, propagates the
@@ -195,12 +266,21 @@ class TypeResolver:
         This handles cases where functions expect typed parameters
         but arguments have no explicit type information.
 
+        Args:
+            func_names: Functions to process (all registered functions if None)
+            changed_args: If given, receives the argument symbols whose type changed
+
         Returns:
             True if any changes were made, False otherwise
         """
         changed = False
 
-        for func_name, signature in self.function_registry.signatures.items():
+        signatures = self.function_registry.signatures
+        if func_names is None:
+            func_names = list(signatures)
+
+        for func_name in func_names:
+            signature = signatures[func_name]
             for param_idx, param_name in enumerate(signature.param_names):
                 # Get parameter's table info
                 param_table_info = self.function_registry.get_param_table_info(
@@ -227,9 +307,13 @@ class TypeResolver:
                     else:
                         # Merge argument type with parameter type
                         merged_type = self._merge_types(arg_type, param_table_info.value_type)
-                        if merged_type != arg_type:
-                            self.inferred_types[arg_symbol_name] = merged_type
-                            changed = True
+                        if merged_type is arg_type:
+                            continue
+                        self.inferred_types[arg_symbol_name] = merged_type
+                        changed = True
+
+                    if changed_args is not None:
+                        changed_args.add(arg_symbol_name)
 
         return changed
 
@@ -244,7 +328,9 @@ class TypeResolver:
             new_type: New type to merge
 
         Returns:
-            Merged type (existing, new_type, or ANY/VARIANT)
+            Merged type (existing, new_type, or ANY/VARIANT). ``existing``
+            itself is returned whenever the merge adds nothing, so callers
+            detect changes with an identity check instead of deep equality.
         """
         if existing.kind == new_type.kind:
             return existing
@@ -255,7 +341,12 @@ class TypeResolver:
         if new_type.kind == TypeKind.UNKNOWN:
             return existing
 
-        return Type(TypeKind.ANY, subtypes=[existing, new_type])
+        existing_mask = existing.kind_mask()
+        merged_mask = existing_mask | new_type.kind_mask()
+        if merged_mask == existing_mask and existing.kind == TypeKind.ANY:
+            return existing
+
+        return Type.any_of_mask(merged_mask)
 
     def _validate_and_finalize(self) -> None:
         """Pass 4: Validate and finalize all types
@@ -269,22 +360,19 @@ class TypeResolver:
         - Detecting unresolved circular dependencies
         - Handling any remaining type conflicts
         """
-        # Count types by kind for statistics
+        # Count types by kind and collect UNKNOWN and conflict (ANY/VARIANT)
+        # symbols in a single pass over the inferred types
         type_counts = {kind: 0 for kind in TypeKind}
         unknown_symbols = []
+        conflict_symbols = []
 
-        # Analyze all inferred types
         for symbol_name, type_obj in self.inferred_types.items():
-            type_counts[type_obj.kind] += 1
+            kind = type_obj.kind
+            type_counts[kind] += 1
 
-            # Track symbols with UNKNOWN type
-            if type_obj.kind == TypeKind.UNKNOWN:
+            if kind == TypeKind.UNKNOWN:
                 unknown_symbols.append(symbol_name)
-
-        # Track conflicts (ANY/VARIANT types)
-        conflict_symbols = []
-        for symbol_name, type_obj in self.inferred_types.items():
-            if type_obj.kind in (TypeKind.ANY, TypeKind.VARIANT):
+            elif kind == TypeKind.ANY or kind == TypeKind.VARIANT:
                 conflict_symbols.append((symbol_name, type_obj))
 
         # Report statistics
@@ -300,37 +388,45 @@ class TypeResolver:
         self._finalize_type_information()
 
     def _infer_statement(self, stmt: astnodes.Node) -> None:
-        """Infer types in a statement
+        """Infer types in a statement, excluding its nested blocks
+
+        Nested statements are visited by _infer_local_types via
+        _nested_statements, so this never recurses.
 
         Args:
             stmt: AST statement to analyze
         """
-        if isinstance(stmt, astnodes.LocalAssign):
-            self._infer_local_assign(stmt)
-        elif isinstance(stmt, astnodes.Assign):
-            self._infer_assign(stmt)
-        elif isinstance(stmt, astnodes.LocalFunction):
-            self._infer_local_function(stmt)
-        elif isinstance(stmt, astnodes.Call):
-            self._infer_expression(stmt)
-        elif isinstance(stmt, astnodes.While):
-            self._infer_expression(stmt.test)
-            for s in stmt.body.body:
-                self._infer_statement(s)
-        elif isinstance(stmt, astnodes.If):
-            self._infer_expression(stmt.test)
-            for s in stmt.body.body:
-                self._infer_statement(s)
-            if stmt.orelse:
-                if isinstance(stmt.orelse, list):
-                    for s in stmt.orelse:
-                        self._infer_statement(s)
-                elif isinstance(stmt.orelse, astnodes.Block):
-                    for s in stmt.orelse.body:
-                        self._infer_statement(s)
-        elif isinstance(stmt, astnodes.Return):
-            for v in (stmt.values or []):
-                self._infer_expression(v)
+        handler = _STATEMENT_HANDLERS.get(type(stmt))
+        if handler is not None:
+            handler(self, stmt)
+
+    @staticmethod
+    def _nested_statements(stmt: astnodes.Node) -> list:
+        """Get statements nested directly inside a statement, in source order
+
+        Args:
+            stmt: AST statement
+
+        Returns:
+            List of nested statements (empty if none)
+        """
+        if isinstance(stmt, (astnodes.While, astnodes.LocalFunction)):
+            return stmt.body.body
+        if isinstance(stmt, astnodes.If):
+            nested = list(stmt.body.body)
+            if isinstance(stmt.orelse, list):
+                nested.extend(stmt.orelse)
+            elif isinstance(stmt.orelse, astnodes.Block):
+                nested.extend(stmt.orelse.body)
+            return nested
+        return []
+
+    def _infer_condition(self, stmt: astnodes.Node) -> None:
+        self._infer_expression(stmt.test)
+
+    def _infer_return(self, stmt: astnodes.Return) -> None:
+        for v in (stmt.values or []):
+            self._infer_expression(v)
 
     def _infer_local_assign(self, stmt: astnodes.LocalAssign) -> None:
         for i, target in enumerate(stmt.targets):
@@ -340,7 +436,7 @@ class TypeResolver:
                     value_type = self._infer_expression(stmt.values[i])
                     self.inferred_types[var_name] = value_type
                 else:
-                    self.inferred_types[var_name] = Type(TypeKind.UNKNOWN)
+                    self.inferred_types[var_name] = Type.of(TypeKind.UNKNOWN)
 
     def _infer_assign(self, stmt: astnodes.Assign) -> None:
         for i, (target, value) in enumerate(zip(stmt.targets, stmt.values)):
@@ -357,62 +453,43 @@ class TypeResolver:
 
     def _infer_local_function(self, stmt: astnodes.LocalFunction) -> None:
         func_name = stmt.name.id if hasattr(stmt.name, 'id') else "anonymous"
-        self.inferred_types[func_name] = Type(TypeKind.FUNCTION)
+        self.inferred_types[func_name] = Type.of(TypeKind.FUNCTION)
 
-        old_function = self._current_function
+        # Body is walked by _infer_local_types with this as enclosing function
         self._current_function = func_name
 
         for param in stmt.args:
             if hasattr(param, 'id'):
-                self.inferred_types[param.id] = Type(TypeKind.UNKNOWN)
-
-        for s in stmt.body.body:
-            self._infer_statement(s)
-
-        self._current_function = old_function
+                self.inferred_types[param.id] = Type.of(TypeKind.UNKNOWN)
 
     def _infer_expression(self, expr: astnodes.Node) -> Type:
-        if isinstance(expr, astnodes.Number):
-            type_info = Type(TypeKind.NUMBER, is_constant=True)
-            ASTAnnotationStore.set_type(expr, type_info)
-            return type_info
-        elif isinstance(expr, astnodes.String):
-            type_info = Type(TypeKind.STRING, is_constant=True)
-            ASTAnnotationStore.set_type(expr, type_info)
-            return type_info
-        elif isinstance(expr, astnodes.TrueExpr) or isinstance(expr, astnodes.FalseExpr):
-            type_info = Type(TypeKind.BOOLEAN, is_constant=True)
-            ASTAnnotationStore.set_type(expr, type_info)
-            return type_info
-        elif isinstance(expr, astnodes.Nil):
-            # nil should be typed as TABLE (TValue) since that's the only type
-            # that can hold nil values in the lua2c runtime
-            type_info = Type(TypeKind.TABLE, is_constant=True)
-            ASTAnnotationStore.set_type(expr, type_info)
-            return type_info
-        elif isinstance(expr, astnodes.Name):
-            type_info = self.inferred_types.get(expr.id, Type(TypeKind.UNKNOWN))
+        literal_type = _LITERAL_TYPES.get(type(expr))
+        if literal_type is not None:
+            ASTAnnotationStore.set_type(expr, literal_type)
+            return literal_type
+        if isinstance(expr, astnodes.Name):
+            type_info = self.inferred_types.get(expr.id, Type.of(TypeKind.UNKNOWN))
             ASTAnnotationStore.set_type(expr, type_info)
             return type_info
         elif isinstance(expr, astnodes.Call):
             self._infer_expression(expr.func)
             for arg in expr.args:
                 self._infer_expression(arg)
-            type_info = Type(TypeKind.UNKNOWN)
+            type_info = Type.of(TypeKind.UNKNOWN)
             ASTAnnotationStore.set_type(expr, type_info)
             return type_info
         elif isinstance(expr, astnodes.Table):
-            type_info = Type(TypeKind.TABLE)
+            type_info = Type.of(TypeKind.TABLE)
             ASTAnnotationStore.set_type(expr, type_info)
             return type_info
         elif isinstance(expr, astnodes.Index):
             self._infer_expression(expr.value)
             self._infer_expression(expr.idx)
-            type_info = Type(TypeKind.UNKNOWN)
+            type_info = Type.of(TypeKind.UNKNOWN)
             ASTAnnotationStore.set_type(expr, type_info)
             return type_info
         elif isinstance(expr, astnodes.AnonymousFunction):
-            type_info = Type(TypeKind.FUNCTION)
+            type_info = Type.of(TypeKind.FUNCTION)
             ASTAnnotationStore.set_type(expr, type_info)
             return type_info
         elif isinstance(expr, (astnodes.AddOp, astnodes.SubOp, astnodes.MultOp,
@@ -426,7 +503,7 @@ class TypeResolver:
         elif isinstance(expr, astnodes.Concat):
             self._infer_expression(expr.left)
             self._infer_expression(expr.right)
-            type_info = Type(TypeKind.STRING)
+            type_info = Type.of(TypeKind.STRING)
             ASTAnnotationStore.set_type(expr, type_info)
             return type_info
         elif isinstance(expr, (astnodes.EqToOp, astnodes.NotEqToOp, astnodes.LessThanOp,
@@ -434,7 +511,7 @@ class TypeResolver:
                                 astnodes.GreaterOrEqThanOp)):
             self._infer_expression(expr.left)
             self._infer_expression(expr.right)
-            type_info = Type(TypeKind.BOOLEAN)
+            type_info = Type.of(TypeKind.BOOLEAN)
             ASTAnnotationStore.set_type(expr, type_info)
             return type_info
         elif isinstance(expr, (astnodes.AndLoOp, astnodes.OrLoOp)):
@@ -449,18 +526,18 @@ class TypeResolver:
             return type_info
         elif isinstance(expr, astnodes.ULNotOp):
             self._infer_expression(expr.operand)
-            type_info = Type(TypeKind.BOOLEAN)
+            type_info = Type.of(TypeKind.BOOLEAN)
             ASTAnnotationStore.set_type(expr, type_info)
             return type_info
 
-        type_info = Type(TypeKind.UNKNOWN)
+        type_info = Type.of(TypeKind.UNKNOWN)
         ASTAnnotationStore.set_type(expr, type_info)
         return type_info
 
     def _infer_arithmetic_result(self, left: Type) -> Type:
         if left.kind == TypeKind.NUMBER:
-            return Type(TypeKind.NUMBER)
-        return Type(TypeKind.UNKNOWN)
+            return Type.of(TypeKind.NUMBER)
+        return Type.of(TypeKind.UNKNOWN)
 
     def get_type(self, symbol: str) -> Type:
         """Get inferred type for a symbol
@@ -471,9 +548,10 @@ class TypeResolver:
         Returns:
             Inferred type or UNKNOWN if not found
         """
-        if symbol in self.inferred_types:
-            return self.inferred_types[symbol]
-        return Type(TypeKind.UNKNOWN)
+        type_info = self.inferred_types.get(symbol)
+        if type_info is not None:
+            return type_info
+        return Type.of(TypeKind.UNKNOWN)
 
     def annotate_node(self, node: astnodes.Node, type_obj: Type) -> None:
         """Attach type information to AST node using ASTAnnotationStore
@@ -543,3 +621,27 @@ class TypeResolver:
         # All types are already stored in self.inferred_types
         # This method is a hook for future finalization steps
         pass
+
+
+# Exact node class -> statement handler for TypeResolver._infer_statement
+_STATEMENT_HANDLERS = {
+    astnodes.LocalAssign: TypeResolver._infer_local_assign,
+    astnodes.Assign: TypeResolver._infer_assign,
+    astnodes.LocalFunction: TypeResolver._infer_local_function,
+    astnodes.Call: TypeResolver._infer_expression,
+    astnodes.While: TypeResolver._infer_condition,
+    astnodes.If: TypeResolver._infer_condition,
+    astnodes.Return: TypeResolver._infer_return,
+}
+
+# Exact literal node class -> shared constant type for
+# TypeResolver._infer_expression; Type instances are never mutated
+_LITERAL_TYPES = {
+    astnodes.Number: Type(TypeKind.NUMBER, is_constant=True),
+    astnodes.String: Type(TypeKind.STRING, is_constant=True),
+    astnodes.TrueExpr: Type(TypeKind.BOOLEAN, is_constant=True),
+    astnodes.FalseExpr: Type(TypeKind.BOOLEAN, is_constant=True),
+    # nil should be typed as TABLE (TValue) since that's the only type
+    # that can hold nil values in the lua2c runtime
+    astnodes.Nil: Type(TypeKind.TABLE, is_constant=True),
+}
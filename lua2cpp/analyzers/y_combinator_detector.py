@@ -13,9 +13,9 @@ except ImportError:
     raise ImportError("luaparser is required. Install with: pip install luaparser")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class YCombinatorWarning:
-    """Warning about detected Y-combinator pattern"""
+    """Warning about detected Y-combinator pattern (immutable, slotted)"""
     line_start: int
     line_end: int
     source_snippet: str
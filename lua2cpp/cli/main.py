@@ -188,8 +188,14 @@ def generate_lib_header(cpp_code: str, module_name: str, has_g_table: bool = Fal
     return '\n'.join(header_lines)
 
 
-def main():
-    """Main entry point for the CLI."""
+def main(argv: Optional[List[str]] = None):
+    """Main entry point for the CLI.
+
+    Args:
+        argv: Command-line arguments without the program name; defaults to
+            sys.argv[1:]. Lets tests and embedders run the CLI in-process
+            instead of spawning a new interpreter.
+    """
     emitter = None
     parser = argparse.ArgumentParser(
         description="Transpile Lua 5.4 source code to C++"
@@ -244,7 +250,7 @@ def main():
         help="Select runtime: 'table' (default TABLE struct) or 'lua_table' (TValue/LuaTable)"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
         args.output_dir.mkdir(parents=True, exist_ok=True)
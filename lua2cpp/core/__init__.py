@@ -1,2 +1,10 @@
 from .library_registry import LibraryFunction, LibraryFunctionRegistry
-from .library_call_collector import LibraryCall, LibraryCallCollector
+
+
+def __getattr__(name: str):
+    # library_call_collector pulls in luaparser; import it on first use so
+    # modules that only need scopes, symbols or types stay light
+    if name in ("LibraryCall", "LibraryCallCollector"):
+        from . import library_call_collector
+        return getattr(library_call_collector, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
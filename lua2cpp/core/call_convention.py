@@ -190,23 +190,21 @@ def flatten_index_chain_parts(node) -> List[str]:
     
     parts = []
     
-    def extract(n):
-        if isinstance(n, astnodes.Name):
-            parts.append(n.id)
-        elif isinstance(n, astnodes.Index):
-            # Add the index part
-            if isinstance(n.idx, astnodes.Name):
-                parts.append(n.idx.id)
-            elif isinstance(n.idx, astnodes.String):
-                s = n.idx.s
-                parts.append(s.decode() if isinstance(s, bytes) else s)
-            # Recurse into value
-            extract(n.value)
-        elif isinstance(n, astnodes.String):
-            s = n.s
+    # Walk the chain from the outermost index inward, then reverse
+    while isinstance(node, astnodes.Index):
+        idx = node.idx
+        if isinstance(idx, astnodes.Name):
+            parts.append(idx.id)
+        elif isinstance(idx, astnodes.String):
+            s = idx.s
             parts.append(s.decode() if isinstance(s, bytes) else s)
+        node = node.value
+    if isinstance(node, astnodes.Name):
+        parts.append(node.id)
+    elif isinstance(node, astnodes.String):
+        s = node.s
+        parts.append(s.decode() if isinstance(s, bytes) else s)
     
-    extract(node)
     parts.reverse()
     return parts
 
@@ -222,8 +220,8 @@ def get_root_module(node) -> str:
     """
     from luaparser import astnodes
     
+    while isinstance(node, astnodes.Index):
+        node = node.value
     if isinstance(node, astnodes.Name):
         return node.id
-    elif isinstance(node, astnodes.Index):
-        return get_root_module(node.value)
     return ""
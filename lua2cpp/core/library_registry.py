@@ -4,27 +4,42 @@ Defines data structures for detecting and describing Lua standard library functi
 Provides lookup methods for library function metadata during transpilation.
 """
 
-from dataclasses import dataclass
-from typing import Optional, Dict, List
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Tuple
 from .types import TypeKind
 
 
-@dataclass
+@dataclass(frozen=True)
 class LibraryFunction:
     """Metadata for a Lua standard library function
 
+    Immutable: definitions are shared by every registry in the process.
+
     Attributes:
         module: Library module name (e.g., "io", "math", "string")
         name: Function name within the module (e.g., "write", "sqrt", "format")
         return_type: Return type of the function
-        params: List of parameter types (for known signatures)
+        params: Tuple of parameter types (for known signatures); lists are converted
         cpp_name: C++ function name (e.g., "io_write", "math_sqrt")
+        is_variadic: True if the last parameter is VARIANT (derived from params)
     """
     module: str
     name: str
     return_type: TypeKind
-    params: List[TypeKind]
+    params: Tuple[TypeKind, ...]
     cpp_name: str
+    is_variadic: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        params = tuple(self.params)
+        object.__setattr__(self, "params", params)
+        object.__setattr__(self, "is_variadic", bool(params) and params[-1] == TypeKind.VARIANT)
+
+
+# Registry class -> (module tables, globals), built on first instantiation.
+# The library definitions are static, so every later registry copies these
+# tables instead of re-creating every LibraryFunction.
+_TABLE_CACHE: Dict[type, Tuple[Dict[str, Dict[str, LibraryFunction]], Dict[str, LibraryFunction]]] = {}
 
 
 class LibraryFunctionRegistry:
@@ -44,7 +59,14 @@ class LibraryFunctionRegistry:
         """Initialize registry with all standard library functions"""
         self._functions: Dict[str, Dict[str, LibraryFunction]] = {}
         self._globals: Dict[str, LibraryFunction] = {}
-        self._initialize_libraries()
+        cached = _TABLE_CACHE.get(type(self))
+        if cached is None:
+            self._initialize_libraries()
+            _TABLE_CACHE[type(self)] = (self._functions, self._globals)
+            cached = _TABLE_CACHE[type(self)]
+        functions, globals_ = cached
+        self._functions = {module: dict(funcs) for module, funcs in functions.items()}
+        self._globals = dict(globals_)
 
     def _initialize_libraries(self) -> None:
         """Initialize all standard library function definitions"""
@@ -268,7 +290,8 @@ class LibraryFunctionRegistry:
         Returns:
             True if the function is from a standard library, False otherwise
         """
-        return module_name in self._functions and func_name in self._functions[module_name]
+        module = self._functions.get(module_name)
+        return module is not None and func_name in module
 
     def get_library_info(self, module_name: str, func_name: str) -> Optional[LibraryFunction]:
         """Get metadata for a library function
@@ -280,9 +303,10 @@ class LibraryFunctionRegistry:
         Returns:
             LibraryFunction if found, None otherwise
         """
-        if module_name in self._functions and func_name in self._functions[module_name]:
-            return self._functions[module_name][func_name]
-        return None
+        module = self._functions.get(module_name)
+        if module is None:
+            return None
+        return module.get(func_name)
 
     def is_global_function(self, name: str) -> bool:
         """Check if a function is a global Lua function
@@ -304,9 +328,7 @@ class LibraryFunctionRegistry:
         Returns:
             LibraryFunction if found, None otherwise
         """
-        if name in self._globals:
-            return self._globals[name]
-        return None
+        return self._globals.get(name)
 
     def get_all_modules(self) -> List[str]:
         """Get list of all registered library modules
@@ -7,6 +7,7 @@ Manages variable scoping following Lua's scoping rules:
 - Global variables are implicitly in the outermost scope
 """
 
+import sys
 from typing import Dict, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -16,6 +17,15 @@ if TYPE_CHECKING:
 class Symbol:
     """Represents a variable or function symbol"""
 
+    __slots__ = (
+        "name",
+        "scope_id",
+        "is_global",
+        "is_function",
+        "param_index",
+        "inferred_type",
+    )
+
     def __init__(
         self,
         name: str,
@@ -61,6 +71,7 @@ class Scope:
         """
         self.parent = parent
         self.symbols: Dict[str, Symbol] = {}
+        self._depth = parent._depth + 1 if parent is not None else 0
         self._next_child_id = 0
 
     def define(self, name: str, **kwargs) -> Symbol:
@@ -75,6 +86,9 @@ class Scope:
         """
         if name in self.symbols:
             raise NameError(f"Symbol '{name}' already defined in scope")
+        # Names come from AST nodes and are rarely interned; interning them
+        # once here lets later lookups with the same name hit by identity
+        name = sys.intern(name)
         symbol = Symbol(name, id(self), **kwargs)
         self.symbols[name] = symbol
         return symbol
@@ -88,10 +102,12 @@ class Scope:
         Returns:
             Symbol if found, None otherwise
         """
-        if name in self.symbols:
-            return self.symbols[name]
-        if self.parent:
-            return self.parent.lookup(name)
+        scope: Optional[Scope] = self
+        while scope is not None:
+            symbol = scope.symbols.get(name)
+            if symbol is not None:
+                return symbol
+            scope = scope.parent
         return None
 
     def lookup_local(self, name: str) -> Optional[Symbol]:
@@ -122,12 +138,7 @@ class Scope:
         Returns:
             Depth (0 for global scope)
         """
-        depth = 0
-        current = self
-        while current.parent:
-            depth += 1
-            current = current.parent
-        return depth
+        return self._depth
 
     def is_global(self) -> bool:
         """Check if this is the global scope
@@ -262,7 +273,7 @@ class ScopeManager:
         Returns:
             Nesting depth (0 for global scope)
         """
-        return self._current_scope.get_depth()
+        return len(self._scope_stack) - 1
 
     def in_function_scope(self) -> bool:
         """Check if currently in a function scope
@@ -270,4 +281,4 @@ class ScopeManager:
         Returns:
             True if depth > 0 (inside a function)
         """
-        return self.current_depth() > 0
+        return len(self._scope_stack) > 1
@@ -4,7 +4,7 @@ Provides unified symbol resolution and management across all scopes.
 Works with ScopeManager to track variables, functions, and their attributes.
 """
 
-from typing import Optional, List
+from typing import Dict, Optional, List
 from .scope import ScopeManager, Symbol
 
 
@@ -19,6 +19,24 @@ class SymbolTable:
         """
         self._scope_manager = scope_manager
         self._all_symbols: List[Symbol] = []
+        # scope_id -> symbols added in that scope, in insertion order
+        self._by_scope: Dict[int, List[Symbol]] = {}
+        # Buckets filled at insertion time so kind queries avoid a full scan
+        self._globals: List[Symbol] = []
+        self._functions: List[Symbol] = []
+        self._locals: List[Symbol] = []
+
+    def _record(self, symbol: Symbol) -> Symbol:
+        """Track a newly defined symbol in the flat list and indexes"""
+        self._all_symbols.append(symbol)
+        self._by_scope.setdefault(symbol.scope_id, []).append(symbol)
+        if symbol.is_global:
+            self._globals.append(symbol)
+        else:
+            self._locals.append(symbol)
+        if symbol.is_function:
+            self._functions.append(symbol)
+        return symbol
 
     def add_local(self, name: str, inferred_type: Optional['Type'] = None, **kwargs) -> Symbol:
         """Add a local variable
@@ -33,9 +51,7 @@ class SymbolTable:
         """
         if inferred_type is not None:
             kwargs['inferred_type'] = inferred_type
-        symbol = self._scope_manager.define_local(name, **kwargs)
-        self._all_symbols.append(symbol)
-        return symbol
+        return self._record(self._scope_manager.define_local(name, **kwargs))
 
     def add_global(self, name: str, **kwargs) -> Symbol:
         """Add a global variable
@@ -47,9 +63,7 @@ class SymbolTable:
         Returns:
             Created symbol
         """
-        symbol = self._scope_manager.define_global(name, **kwargs)
-        self._all_symbols.append(symbol)
-        return symbol
+        return self._record(self._scope_manager.define_global(name, **kwargs))
 
     def add_function(self, name: str, is_global: bool = False) -> Symbol:
         """Add a function definition
@@ -75,9 +89,7 @@ class SymbolTable:
         Returns:
             Created symbol
         """
-        symbol = self._scope_manager.define_function_param(name, param_index)
-        self._all_symbols.append(symbol)
-        return symbol
+        return self._record(self._scope_manager.define_function_param(name, param_index))
 
     def resolve(self, name: str) -> Optional[Symbol]:
         """Resolve a symbol by name
@@ -124,7 +136,7 @@ class SymbolTable:
         Returns:
             List of symbols in that scope
         """
-        return [s for s in self._all_symbols if s.scope_id == scope_id]
+        return list(self._by_scope.get(scope_id, ()))
 
     def get_global_symbols(self) -> List[Symbol]:
         """Get all global symbols
@@ -132,7 +144,7 @@ class SymbolTable:
         Returns:
             List of global symbols
         """
-        return [s for s in self._all_symbols if s.is_global]
+        return list(self._globals)
 
     def get_function_symbols(self) -> List[Symbol]:
         """Get all function symbols
@@ -140,7 +152,7 @@ class SymbolTable:
         Returns:
             List of function symbols
         """
-        return [s for s in self._all_symbols if s.is_function]
+        return list(self._functions)
 
     def get_local_symbols(self) -> List[Symbol]:
         """Get all local symbols
@@ -148,7 +160,7 @@ class SymbolTable:
         Returns:
             List of local symbols
         """
-        return [s for s in self._all_symbols if not s.is_global]
+        return list(self._locals)
 
     def is_defined(self, name: str) -> bool:
         """Check if name is defined
@@ -198,3 +210,7 @@ class SymbolTable:
     def clear(self) -> None:
         """Clear all symbols (except scope structure)"""
         self._all_symbols.clear()
+        self._by_scope.clear()
+        self._globals.clear()
+        self._functions.clear()
+        self._locals.clear()
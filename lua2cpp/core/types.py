@@ -6,7 +6,7 @@ attaching type information to AST nodes.
 
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import List, Optional, Any, Set
+from typing import Dict, Optional, Any, Set, Tuple
 
 
 class TypeKind(Enum):
@@ -22,13 +22,67 @@ class TypeKind(Enum):
     VARIANT = 7  # std::variant<...> for dynamic types
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Type:
-    """Represents a type in the type system"""
+    """Represents a type in the type system
+
+    Immutable and slotted: instances are shared between AST annotations
+    and symbol tables, so build a new Type instead of mutating one.
+    """
 
     kind: TypeKind
     is_constant: bool = False
-    subtypes: List['Type'] = field(default_factory=list)
+    subtypes: Tuple['Type', ...] = ()
+
+    @classmethod
+    def of(cls, kind: TypeKind) -> 'Type':
+        """Get the shared plain (non-constant, subtype-less) Type for a kind
+
+        Args:
+            kind: Type category
+
+        Returns:
+            Type: Cached instance, identical across calls
+        """
+        pooled = _TYPE_POOL.get(kind)
+        if pooled is None:
+            pooled = _TYPE_POOL[kind] = cls(kind)
+        return pooled
+
+    def kind_mask(self) -> int:
+        """Bitmask of the kinds this type may hold, one bit per TypeKind value
+
+        ANY/VARIANT types with subtypes contribute the union of their
+        subtypes' masks, so nested merges flatten to the leaf kinds.
+
+        Returns:
+            int: Bitmask with bit ``kind.value`` set for each possible kind
+        """
+        if self.subtypes and self.kind in (TypeKind.ANY, TypeKind.VARIANT):
+            mask = 0
+            for subtype in self.subtypes:
+                mask |= subtype.kind_mask()
+            return mask
+        return 1 << self.kind.value
+
+    @classmethod
+    def any_of_mask(cls, mask: int) -> 'Type':
+        """Get the ANY type whose subtypes are the kinds set in a mask
+
+        Instances are interned per mask, so repeated conflicts between the
+        same kinds share one object.
+
+        Args:
+            mask: Bitmask as returned by kind_mask()
+
+        Returns:
+            Type: ANY type with one plain subtype per set bit, in TypeKind order
+        """
+        pooled = _ANY_POOL.get(mask)
+        if pooled is None:
+            subtypes = tuple(cls.of(kind) for kind in TypeKind if mask >> kind.value & 1)
+            pooled = _ANY_POOL[mask] = cls(TypeKind.ANY, subtypes=subtypes)
+        return pooled
 
     def can_specialize(self) -> bool:
         """Check if this type can use concrete C++ type"""
@@ -40,31 +94,31 @@ class Type:
         Returns:
             str: C++ type name
         """
-        if self.kind == TypeKind.UNKNOWN:
-            return "auto"
-        elif self.kind == TypeKind.VARIANT:
-            # inner_types = [t.cpp_type() for t in self.subtypes]
-            # if not inner_types:
-            #     return "ANY"
-            # return f"ANY({', '.join(inner_types)})"
-            return "ANY"
-        elif self.kind == TypeKind.BOOLEAN:
-            return "BOOLEAN"
-        elif self.kind == TypeKind.NUMBER:
-            return "NUMBER"
-        elif self.kind == TypeKind.STRING:
-            return "STRING"
-        elif self.kind == TypeKind.TABLE:
-            return "TABLE"
-        elif self.kind == TypeKind.FUNCTION:
-            return "auto"
-        elif self.kind == TypeKind.ANY:
-            return "ANY"
-        else:
-            return "auto"
-
-
-@dataclass
+        # VARIANT could list its subtypes, e.g. ANY(NUMBER, STRING):
+        # inner_types = [t.cpp_type() for t in self.subtypes]
+        return _CPP_TYPE_NAMES.get(self.kind, "auto")
+
+
+# TypeKind -> C++ type name for Type.cpp_type()
+_CPP_TYPE_NAMES: Dict[TypeKind, str] = {
+    TypeKind.UNKNOWN: "auto",
+    TypeKind.VARIANT: "ANY",
+    TypeKind.BOOLEAN: "BOOLEAN",
+    TypeKind.NUMBER: "NUMBER",
+    TypeKind.STRING: "STRING",
+    TypeKind.TABLE: "TABLE",
+    TypeKind.FUNCTION: "auto",
+    TypeKind.ANY: "ANY",
+}
+
+# Plain Type instances shared by Type.of()
+_TYPE_POOL: Dict[TypeKind, Type] = {}
+
+# Merged ANY types shared by Type.any_of_mask(), keyed by kind mask
+_ANY_POOL: Dict[int, Type] = {}
+
+
+@dataclass(slots=True)
 class TableTypeInfo:
     """Type information for table variables
 
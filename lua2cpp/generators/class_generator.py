@@ -10,7 +10,7 @@ Translation rules (from oop_translation_spec.md):
 - Parent.init(self, ...) -> parent constructor call in initializer list
 """
 
-from typing import List, Dict, Optional, Set, Tuple, Any
+from typing import AbstractSet, List, Dict, Optional, Set, Tuple, Any
 from dataclasses import dataclass, field
 
 try:
@@ -29,6 +29,7 @@ class MethodInfo:
     params: List[str]
     body: Any  # astnodes.Block
     parent_init_call: Optional[Tuple[str, List[Any]]] = None  # (parent_class, args)
+    parent_init_ids: Set[int] = field(default_factory=set)  # id()s of Parent.init Calls in body
 
 
 @dataclass 
@@ -53,11 +54,24 @@ class ClassDetector(ASTVisitor):
         super().__init__()
         self.classes: Dict[str, ClassInfo] = {}
         self._current_class: Optional[str] = None
+        # Chunks already scanned, keyed by id (value keeps the id alive)
+        self._detected_chunks: Dict[int, astnodes.Chunk] = {}
         
     def detect(self, chunk: astnodes.Chunk) -> Dict[str, ClassInfo]:
-        """Scan AST and return detected classes"""
-        self.visit(chunk)
+        """Scan AST and return detected classes
+
+        A chunk is only scanned once; repeated calls return the cached
+        classes instead of appending the same methods again.
+        """
+        if id(chunk) not in self._detected_chunks:
+            self._detected_chunks[id(chunk)] = chunk
+            self.visit(chunk)
         return self.classes
+
+    def invalidate(self) -> None:
+        """Drop detected classes so the next detect() rescans"""
+        self.classes = {}
+        self._detected_chunks.clear()
     
     def visit_Assign(self, node: astnodes.Assign) -> None:
         """Detect Class = Parent:extend() pattern"""
@@ -101,14 +115,17 @@ class ClassDetector(ASTVisitor):
                             params.append(arg.id)
                     
                     # Look for Parent.init(self, ...) calls in the body
-                    parent_init = self._find_parent_init_call(node.body, self.classes[class_name].parent)
+                    parent_class = self.classes[class_name].parent
+                    parent_inits = self._find_parent_init_calls(node.body, parent_class)
+                    parent_init = parent_inits[0] if parent_inits else None
                     
                     method = MethodInfo(
                         name=method_name,
                         is_constructor=is_constructor,
                         params=params,
                         body=node.body,
-                        parent_init_call=parent_init
+                        parent_init_call=(parent_class, parent_init.args) if parent_init else None,
+                        parent_init_ids={id(call) for call in parent_inits}
                     )
                     self.classes[class_name].methods.append(method)
         
@@ -135,45 +152,43 @@ class ClassDetector(ASTVisitor):
                         params.append(arg.id)
                 
                 # Look for Parent.init(self, ...) calls in the body
-                parent_init = self._find_parent_init_call(node.body, self.classes[class_name].parent)
+                parent_class = self.classes[class_name].parent
+                parent_inits = self._find_parent_init_calls(node.body, parent_class)
+                parent_init = parent_inits[0] if parent_inits else None
                 
                 method = MethodInfo(
                     name=method_name,
                     is_constructor=is_constructor,
                     params=params,
                     body=node.body,
-                    parent_init_call=parent_init
+                    parent_init_call=(parent_class, parent_init.args) if parent_init else None,
+                    parent_init_ids={id(call) for call in parent_inits}
                 )
                 self.classes[class_name].methods.append(method)
     
-    def _find_parent_init_call(self, body: astnodes.Block, parent_class: str) -> Optional[Tuple[str, List[Any]]]:
-        """Find ParentClass.init(self, ...) call in function body"""
+    def _find_parent_init_calls(self, body: astnodes.Block, parent_class: str) -> List[astnodes.Call]:
+        """Find every ParentClass.init(self, ...) call in function body
+
+        Returns:
+            Matching Call nodes in source order, recorded on MethodInfo so
+            code generation does not have to re-check each statement
+        """
         if not body or not hasattr(body, 'body'):
-            return None
+            return []
             
         stmts = body.body if isinstance(body.body, list) else [body.body]
+        calls = []
         
         for stmt in stmts:
-            # Look for Call nodes
-            if isinstance(stmt, astnodes.Call):
-                call = stmt
-                # Check for Parent.init(self, ...) pattern
-                if isinstance(call.func, astnodes.Index):
-                    if (isinstance(call.func.value, astnodes.Name) and
-                        isinstance(call.func.idx, astnodes.Name) and
-                        call.func.idx.id == "init"):
-                        potential_parent = call.func.value.id
-                        if potential_parent == parent_class:
-                            # Found parent init call
-                            return (parent_class, call.args)
+            # Check for Parent.init(self, ...) pattern
+            if _is_parent_init_call(stmt, parent_class):
+                calls.append(stmt)
             
             # Recursively check inside if/while/etc blocks
-            if hasattr(stmt, 'body') and isinstance(stmt, astnodes.Block):
-                result = self._find_parent_init_call(stmt, parent_class)
-                if result:
-                    return result
+            elif hasattr(stmt, 'body') and isinstance(stmt, astnodes.Block):
+                calls.extend(self._find_parent_init_calls(stmt, parent_class))
                      
-        return None
+        return calls
 
 
 class ClassGenerator:
@@ -519,7 +534,7 @@ def _generate_constructor_body(class_info: ClassInfo, method: MethodInfo) -> str
             body_stmts = method.body.body if isinstance(method.body.body, list) else [method.body.body]
             for stmt in body_stmts:
                 # Translate statement with self -> this and parent init support
-                code = _translate_statement(stmt, parent_class=class_info.parent)
+                code = _translate_statement(stmt, parent_init_ids=method.parent_init_ids)
                 if code:
                     lines.append(f"    {code}")
 
@@ -543,7 +558,7 @@ def _generate_method_body(class_info: ClassInfo, method: MethodInfo) -> str:
     if method.body and hasattr(method.body, 'body'):
         body_stmts = method.body.body if isinstance(method.body.body, list) else [method.body.body]
         for stmt in body_stmts:
-            code = _translate_statement(stmt, parent_class=class_info.parent)
+            code = _translate_statement(stmt, parent_init_ids=method.parent_init_ids)
             if code:
                 lines.append(f"    {code}")
     
@@ -565,12 +580,14 @@ def _is_parent_init_call(stmt: Any, parent_class: str) -> bool:
     return False
 
 
-def _translate_statement(stmt: Any, parent_class: Optional[str] = None) -> Optional[str]:
+def _translate_statement(stmt: Any, parent_class: Optional[str] = None,
+                         parent_init_ids: AbstractSet[int] = frozenset()) -> Optional[str]:
     """Translate a single statement to C++
     
     Args:
         stmt: AST statement to translate
         parent_class: Parent class name to check for init call
+        parent_init_ids: id()s of parent init Calls found by ClassDetector
     
     Returns:
         Translated C++ code or None if not a statement
@@ -581,7 +598,7 @@ def _translate_statement(stmt: Any, parent_class: Optional[str] = None) -> Optio
     class_name = stmt.__class__.__name__
     
     if class_name == 'Call':
-        if parent_class and _is_parent_init_call(stmt, parent_class):
+        if id(stmt) in parent_init_ids or (parent_class and _is_parent_init_call(stmt, parent_class)):
             func = stmt.func
             args_translated = []
             for arg in stmt.args[1:]:
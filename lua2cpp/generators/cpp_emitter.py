@@ -10,7 +10,7 @@ Architecture:
 - Module body with remaining statements
 """
 
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from pathlib import Path
 
 try:
@@ -31,6 +31,43 @@ from ..core.library_registry import LibraryFunctionRegistry
 from ..core.call_convention import CallConventionRegistry
 
 
+# TypeKind -> C++ type of a module state variable; anything not a plain
+# NUMBER/STRING/BOOLEAN is held as a TABLE (TValue) reference
+_MODULE_STATE_CPP_TYPES = {
+    TypeKind.NUMBER: "NUMBER",
+    TypeKind.STRING: "STRING",
+    TypeKind.BOOLEAN: "BOOLEAN",
+    TypeKind.TABLE: "TABLE",
+    TypeKind.FUNCTION: "TABLE",  # Functions stored as table references
+    TypeKind.ANY: "TABLE",
+    TypeKind.VARIANT: "TABLE",
+    TypeKind.UNKNOWN: "TABLE",
+}
+
+# Node class -> public, non-method attribute names defined on the class
+_CLASS_ATTR_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _public_attr_names(node: astnodes.Node) -> List[str]:
+    """Public data attribute names of node, as dir() lists them minus methods
+
+    The detection walkers below look at every attribute of every node;
+    dir() rebuilds and sorts the full name list, methods included, each
+    time. Class-level names are resolved once per node class instead.
+    """
+    cls = type(node)
+    class_names = _CLASS_ATTR_NAMES.get(cls)
+    if class_names is None:
+        class_names = _CLASS_ATTR_NAMES[cls] = tuple(
+            name for name in dir(cls)
+            if not name.startswith('_') and not callable(getattr(cls, name, None))
+        )
+    instance_attrs = getattr(node, '__dict__', {})
+    names = [name for name in instance_attrs if not name.startswith('_')]
+    names.extend(name for name in class_names if name not in instance_attrs)
+    return names
+
+
 class CppEmitter:
     """Emits complete C++ code from Lua AST
 
@@ -467,19 +504,7 @@ class CppEmitter:
         Returns:
             C++ type name string (NUMBER, STRING, TABLE, etc.)
         """
-        from ..core.types import TypeKind
-        
-        type_map = {
-            TypeKind.NUMBER: "NUMBER",
-            TypeKind.STRING: "STRING",
-            TypeKind.BOOLEAN: "BOOLEAN",
-            TypeKind.TABLE: "TABLE",
-            TypeKind.FUNCTION: "TABLE",  # Functions stored as table references
-            TypeKind.ANY: "TABLE",
-            TypeKind.VARIANT: "TABLE",
-            TypeKind.UNKNOWN: "TABLE",
-        }
-        return type_map.get(type_kind, "TABLE")
+        return _MODULE_STATE_CPP_TYPES.get(type_kind, "TABLE")
 
     def _generate_header_file(
         self,
@@ -702,7 +727,7 @@ class CppEmitter:
                     if arg_type == "Name" and hasattr(arg, 'id') and arg.id == "arg":
                         has_explicit_arg_decl = True
 
-            for attr_name in dir(node):
+            for attr_name in _public_attr_names(node):
                 if not attr_name.startswith('_') and attr_name not in ('fields', 'args', 'targets', 'key'):
                     attr = getattr(node, attr_name, None)
                     if attr is not None:
@@ -732,7 +757,7 @@ class CppEmitter:
                         if field_key_type == "Name" and hasattr(field.key, 'id') and field.key.id == "arg":
                             return False
 
-            for attr_name in dir(node):
+            for attr_name in _public_attr_names(node):
                 if not attr_name.startswith('_') and attr_name not in ('fields', 'targets', 'key'):
                     attr = getattr(node, attr_name, None)
                     if attr is not None:
@@ -769,7 +794,7 @@ class CppEmitter:
                 if source_type == "Name" and hasattr(node.source, 'id') and node.source.id == "love":
                     return True
 
-            for attr_name in dir(node):
+            for attr_name in _public_attr_names(node):
                 if not attr_name.startswith('_') and attr_name not in ('fields', 'key'):
                     attr = getattr(node, attr_name, None)
                     if attr is not None:
@@ -801,7 +826,7 @@ class CppEmitter:
                 if value_type == "Name" and hasattr(node.value, 'id') and node.value.id == "G":
                     return True
 
-            for attr_name in dir(node):
+            for attr_name in _public_attr_names(node):
                 if not attr_name.startswith('_') and attr_name not in ('fields', 'key'):
                     attr = getattr(node, attr_name, None)
                     if attr is not None:
@@ -831,7 +856,7 @@ class CppEmitter:
                     self._module_deps.add(module_path)
                     self._module_externs.add(cpp_var)
 
-            for attr_name in dir(node):
+            for attr_name in _public_attr_names(node):
                 if not attr_name.startswith('_') and attr_name not in ('fields', 'key'):
                     attr = getattr(node, attr_name, None)
                     if attr is not None:
@@ -862,6 +887,7 @@ class CppEmitter:
 
         # Then collect global Assign targets, excluding those already declared locally
         global_vars = []
+        seen = set(local_declared)  # local names plus globals already collected
         for stmt in (chunk.body.body if isinstance(chunk.body.body, list) else [chunk.body.body]):
             if type(stmt).__name__ == "Assign" and hasattr(stmt, 'targets'):
                 # Skip if inside a function
@@ -871,9 +897,9 @@ class CppEmitter:
                 for target in stmt.targets:
                     target_type = type(target).__name__
                     if target_type == "Name" and hasattr(target, 'id'):
-                        # Skip if already declared via LocalAssign
                         # Skip if already declared via LocalAssign or already in global_vars
-                        if target.id not in local_declared and target.id not in global_vars:
+                        if target.id not in seen:
+                            seen.add(target.id)
                             global_vars.append(target.id)
         return global_vars
 
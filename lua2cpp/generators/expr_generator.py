@@ -4,6 +4,7 @@ Generates C++ code from Lua AST expression nodes.
 Implements double-dispatch pattern for literal and name expressions.
 """
 
+import functools
 from typing import Any, Optional, Set, TYPE_CHECKING, Dict
 from ..core.ast_visitor import ASTVisitor
 from ..core.library_registry import LibraryFunctionRegistry as _LibraryFunctionRegistry
@@ -21,6 +22,51 @@ if TYPE_CHECKING:
     from ..core.library_registry import LibraryFunctionRegistry
 
 
+# string.* methods -> string_lib:: function names
+_STRING_LIB_METHODS: Dict[str, str] = {
+    'format': 'format', 'len': 'len', 'sub': 'sub',
+    'upper': 'upper', 'lower': 'lower', 'byte': 'byte',
+    'char': 'char_', 'rep': 'rep', 'find': 'find',
+    'gsub': 'gsub', 'match': 'match', 'gmatch': 'gmatch'
+}
+
+# io/math/table/os functions -> l2c:: function names
+_L2C_LIB_FUNCS: Dict[str, Dict[str, str]] = {
+    'io': {'write': 'io_write', 'flush': 'io_flush', 'read': 'io_read'},
+    'math': {'sqrt': 'math_sqrt', 'abs': 'math_abs', 'floor': 'math_floor',
+             'ceil': 'math_ceil', 'sin': 'math_sin', 'cos': 'math_cos',
+             'tan': 'math_tan', 'log': 'math_log', 'exp': 'math_exp',
+             'pow': 'math_pow', 'min': 'math_min', 'max': 'math_max',
+             'random': 'math_random', 'randomseed': 'math_randomseed',
+             'modf': 'math_modf', 'fmod': 'math_fmod', 'atan': 'math_atan',
+             'asin': 'math_asin', 'acos': 'math_acos', 'deg': 'math_deg',
+             'rad': 'math_rad', 'huge': 'math_huge'},
+    'table': {'unpack': 'table_unpack', 'remove': 'table_remove', 'sort': 'table_sort',
+              'concat': 'table_concat', 'insert': 'table_insert', 'pack': 'table_pack'},
+    'os': {'clock': 'os_clock', 'time': 'os_time', 'date': 'os_date', 'exit': 'os_exit',
+           'difftime': 'os_difftime', 'getenv': 'os_getenv', 'remove': 'os_remove',
+           'rename': 'os_rename', 'tmpname': 'os_tmpname'},
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _cpp_string_literal(content: str) -> str:
+    """Quote and escape a Lua string for C++ output
+
+    Memoized: the same keys and messages recur throughout a program.
+    """
+    # C++ string literals need escapes for: ", \, newline, tab, etc.
+    escaped = (
+        content
+        .replace('\\', '\\\\')
+        .replace('"', '\\"')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+        .replace('\t', '\\t')
+    )
+    return f'"{escaped}"'
+
+
 class ExprGenerator(ASTVisitor):
     """Generates C++ code from Lua AST expression nodes
 
@@ -104,18 +150,7 @@ class ExprGenerator(ASTVisitor):
         """
         # String node's .s attribute contains bytes, need to decode
         content = node.s.decode() if isinstance(node.s, bytes) else node.s
-
-        # Escape special characters for C++ output
-        # C++ string literals need escapes for: ", \, newline, tab, etc.
-        escaped = (
-            content
-            .replace('\\', '\\\\')
-            .replace('"', '\\"')
-            .replace('\n', '\\n')
-            .replace('\r', '\\r')
-            .replace('\t', '\\t')
-        )
-        return f'"{escaped}"'
+        return _cpp_string_literal(content)
 
     def visit_TrueExpr(self, node: astnodes.TrueExpr) -> str:
         """Generate C++ true boolean literal
@@ -506,59 +541,19 @@ class ExprGenerator(ASTVisitor):
         lib_name = node.func.value.id
         method_name = node.func.idx.id if hasattr(node.func.idx, 'id') else str(node.func.idx)
         
-        lib_func_map = {
-            'io': {'write': 'io_write', 'flush': 'io_flush', 'read': 'io_read'},
-            'string': {'format': 'string_format', 'len': 'string_len', 'sub': 'string_sub', 
-                       'upper': 'string_upper', 'lower': 'string_lower', 'byte': 'string_byte',
-                       'char': 'string_char', 'rep': 'string_rep', 'find': 'string_find',
-                       'gsub': 'string_gsub', 'match': 'string_match', 'gmatch': 'string_gmatch'},
-            'math': {'sqrt': 'math_sqrt', 'abs': 'math_abs', 'floor': 'math_floor',
-                     'ceil': 'math_ceil', 'sin': 'math_sin', 'cos': 'math_cos',
-                     'tan': 'math_tan', 'log': 'math_log', 'exp': 'math_exp',
-                     'pow': 'math_pow', 'min': 'math_min', 'max': 'math_max',
-                     'random': 'math_random', 'randomseed': 'math_randomseed',
-                     'modf': 'math_modf', 'fmod': 'math_fmod', 'atan': 'math_atan',
-                     'asin': 'math_asin', 'acos': 'math_acos', 'deg': 'math_deg',
-                     'rad': 'math_rad', 'huge': 'math_huge'},
-            'table': {'unpack': 'table_unpack', 'remove': 'table_remove', 'sort': 'table_sort',
-                      'concat': 'table_concat', 'insert': 'table_insert', 'pack': 'table_pack'},
-            'os': {'clock': 'os_clock', 'time': 'os_time', 'date': 'os_date', 'exit': 'os_exit',
-                   'difftime': 'os_difftime', 'getenv': 'os_getenv', 'remove': 'os_remove',
-                   'rename': 'os_rename', 'tmpname': 'os_tmpname'},
-        }
-        
         # Use appropriate namespace based on library
         args_str = ", ".join(args) if args else ""
         
         # String library uses string_lib:: namespace (has TValue-aware implementations)
         if lib_name == 'string':
-            method_map = {
-                'format': 'format', 'len': 'len', 'sub': 'sub',
-                'upper': 'upper', 'lower': 'lower', 'byte': 'byte',
-                'char': 'char_', 'rep': 'rep', 'find': 'find',
-                'gsub': 'gsub', 'match': 'match', 'gmatch': 'gmatch'
-            }
-            func_name = method_map.get(method_name, method_name)
+            func_name = _STRING_LIB_METHODS.get(method_name, method_name)
             return f"string_lib::{func_name}({args_str})"
         
         # Table, io, math, os libraries use l2c:: namespace
-        lib_func_map = {
-            'io': {'write': 'io_write', 'flush': 'io_flush', 'read': 'io_read'},
-            'math': {'sqrt': 'math_sqrt', 'abs': 'math_abs', 'floor': 'math_floor',
-                     'ceil': 'math_ceil', 'sin': 'math_sin', 'cos': 'math_cos',
-                     'tan': 'math_tan', 'log': 'math_log', 'exp': 'math_exp',
-                     'pow': 'math_pow', 'min': 'math_min', 'max': 'math_max',
-                     'random': 'math_random', 'randomseed': 'math_randomseed',
-                     'modf': 'math_modf', 'fmod': 'math_fmod', 'atan': 'math_atan',
-                     'asin': 'math_asin', 'acos': 'math_acos', 'deg': 'math_deg',
-                     'rad': 'math_rad', 'huge': 'math_huge'},
-            'table': {'unpack': 'table_unpack', 'remove': 'table_remove', 'sort': 'table_sort',
-                      'concat': 'table_concat', 'insert': 'table_insert', 'pack': 'table_pack'},
-            'os': {'clock': 'os_clock', 'time': 'os_time', 'date': 'os_date', 'exit': 'os_exit',
-                   'difftime': 'os_difftime', 'getenv': 'os_getenv', 'remove': 'os_remove',
-                   'rename': 'os_rename', 'tmpname': 'os_tmpname'},
-        }
-        func_name = lib_func_map.get(lib_name, {}).get(method_name, f"{lib_name}_{method_name}")
+        module_funcs = _L2C_LIB_FUNCS.get(lib_name)
+        func_name = module_funcs.get(method_name) if module_funcs is not None else None
+        if func_name is None:
+            func_name = f"{lib_name}_{method_name}"
         return f"l2c::{func_name}({args_str})"
 
     def _generate_g_table_access(self, node: astnodes.Index) -> str:
@@ -7,6 +7,7 @@ for Lua standard library functions used in transpiled code.
 from typing import List, Set, Optional
 from ..core.library_registry import LibraryFunctionRegistry, LibraryFunction
 from ..core.library_call_collector import LibraryCall
+from ..core.types import Type
 
 
 class HeaderGenerator:
@@ -163,8 +164,7 @@ class HeaderGenerator:
             params = self._build_parameter_list(func_info.params)
 
             # Generate template function for variadic functions
-            from ..core.types import TypeKind
-            if len(func_info.params) > 0 and func_info.params[-1] == TypeKind.VARIANT:
+            if func_info.is_variadic:
                 # Variadic function - use template
                 lines.append(f"    template <typename... Args>")
                 lines.append(f"    static {return_type} {cpp_name}(State* state, Args&&... args);")
@@ -227,26 +227,7 @@ class HeaderGenerator:
         Returns:
             C++ type name as string
         """
-        from ..core.types import TypeKind
-
-        if type_kind == TypeKind.UNKNOWN:
-            return "auto"
-        elif type_kind == TypeKind.VARIANT:
-            return "ANY"
-        elif type_kind == TypeKind.BOOLEAN:
-            return "BOOLEAN"
-        elif type_kind == TypeKind.NUMBER:
-            return "NUMBER"
-        elif type_kind == TypeKind.STRING:
-            return "STRING"
-        elif type_kind == TypeKind.TABLE:
-            return "TABLE"
-        elif type_kind == TypeKind.FUNCTION:
-            return "auto"
-        elif type_kind == TypeKind.ANY:
-            return "ANY"
-        else:
-            return "auto"
+        return Type.of(type_kind).cpp_type()
 
     def _build_parameter_list(self, param_types: List) -> str:
         """Build parameter list string for function declaration
@@ -257,8 +238,6 @@ class HeaderGenerator:
         Returns:
             Parameter list as string (e.g., "State* state, double x, std::string s")
         """
-        from ..core.types import TypeKind
-
         params = ["State* state"]
 
         for param_type in param_types:
@@ -36,6 +36,10 @@ if TYPE_CHECKING:
 from ..core.call_convention import CallConventionRegistry, CallConvention, flatten_index_chain_parts, get_root_module
 
 
+# Generated-code prefixes of bare library table references, e.g. math["floor"]
+_LIBRARY_REF_PREFIXES = ('math[', 'string[', 'io[', 'table[', 'os[')
+
+
 class StmtGenerator(ASTVisitor):
     """Generates C++ code from Lua AST statement nodes
 
@@ -191,11 +195,7 @@ class StmtGenerator(ASTVisitor):
                 # Function CALL: local x = tonumber(y) (Call node)
                 is_library_ref = (
                     isinstance(init_expr, astnodes.Index) and
-                    (expr_code.startswith('math[') or  # e.g., math["floor"]
-                     expr_code.startswith('string[') or  # e.g., string["format"]
-                     expr_code.startswith('io[') or  # e.g., io["write"]
-                     expr_code.startswith('table[') or  # e.g., table["concat"]
-                     expr_code.startswith('os[') or  # e.g., os["time"]
+                    (expr_code.startswith(_LIBRARY_REF_PREFIXES) or
                      '::' in expr_code)  # e.g., math_lib::floor
                 )
 
@@ -4,17 +4,42 @@ Compare output from Lua interpreter and C++ executable.
 Supports floating-point tolerance for numeric comparisons.
 """
 
+import re
 import sys
 import math
-from typing import List, Tuple
+import itertools
+from typing import List, Optional, Tuple
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # NumPy not available, use the per-line comparison only
 
-def parse_number(s: str) -> float:
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # Numba not available, use the NumPy expression instead
+
+# Below this many lines the NumPy setup cost outweighs the vectorized compare
+NUMPY_MIN_LINES = 1000
+
+# Lines read from each file at a time by compare_files
+BLOCK_LINES = 65536
+
+# Strings float() accepts that Lua or C++ print for numbers, including inf/nan
+_NUMBER_RE = re.compile(
+    r'[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|inf(?:inity)?|nan)',
+    re.IGNORECASE,
+)
+
+
+def parse_number(s: str) -> Optional[float]:
     """Try to parse a string as a number."""
-    try:
-        return float(s.strip())
-    except ValueError:
-        return None
+    s = s.strip()
+    # Pre-check avoids raising ValueError for every non-numeric line
+    if _NUMBER_RE.fullmatch(s):
+        return float(s)
+    return None
 
 
 def compare_lines(lua_line: str, cpp_line: str, tolerance: float = 1e-6) -> Tuple[bool, str]:
@@ -24,6 +49,10 @@ def compare_lines(lua_line: str, cpp_line: str, tolerance: float = 1e-6) -> Tupl
     Returns:
         (matches, message)
     """
+    # Most lines match byte-for-byte; skip stripping and number parsing
+    if lua_line == cpp_line:
+        return True, "Exact match"
+
     lua_stripped = lua_line.strip()
     cpp_stripped = cpp_line.strip()
     
@@ -52,40 +81,144 @@ def compare_lines(lua_line: str, cpp_line: str, tolerance: float = 1e-6) -> Tupl
         return False, f"String mismatch: lua='{lua_stripped}', cpp='{cpp_stripped}'"
 
 
+if np is not None and njit is not None:
+    @njit(cache=True)
+    def _find_out_of_tolerance(lua_vals, cpp_vals, tolerance):
+        """Single fused loop over both arrays; returns out-of-tolerance indices."""
+        out = np.empty(lua_vals.shape[0], dtype=np.int64)
+        count = 0
+        for i in range(lua_vals.shape[0]):
+            diff = abs(lua_vals[i] - cpp_vals[i])
+            max_val = max(abs(lua_vals[i]), abs(cpp_vals[i]))
+            rel_diff = diff / max_val if max_val != 0 else diff
+            # Negated so NaN counts as a mismatch, matching compare_lines
+            if not rel_diff <= tolerance:
+                out[count] = i
+                count += 1
+        return out[:count]
+else:
+    _find_out_of_tolerance = None
+
+
+def find_numeric_mismatches(lua_lines: List[str], cpp_lines: List[str],
+                            tolerance: float = 1e-6) -> Optional[List[int]]:
+    """
+    Vectorized tolerance check for outputs where every line is a number.
+
+    Returns:
+        Zero-based indices of out-of-tolerance lines, or None when NumPy is
+        unavailable or some line is not numeric (caller must use compare_lines)
+    """
+    if np is None:
+        return None
+
+    # float() also accepts forms parse_number rejects (e.g. "1_0"), so only
+    # lines compare_lines would read as numbers may take this path
+    if not all(_NUMBER_RE.fullmatch(line.strip())
+               for line in itertools.chain(lua_lines, cpp_lines)):
+        return None
+
+    try:
+        lua_vals = np.array(lua_lines, dtype=np.float64)
+        cpp_vals = np.array(cpp_lines, dtype=np.float64)
+    except ValueError:
+        return None
+
+    if _find_out_of_tolerance is not None:
+        return _find_out_of_tolerance(lua_vals, cpp_vals, tolerance).tolist()
+
+    with np.errstate(invalid='ignore'):  # inf - inf is NaN, a mismatch below
+        diff = np.abs(lua_vals - cpp_vals)
+    max_val = np.maximum(np.abs(lua_vals), np.abs(cpp_vals))
+    rel_diff = np.divide(diff, max_val, out=diff.copy(), where=max_val != 0)
+
+    # Negated so NaN counts as a mismatch, matching compare_lines
+    return np.flatnonzero(~(rel_diff <= tolerance)).tolist()
+
+
+def compare_block(lua_lines: List[str], cpp_lines: List[str], first_line: int,
+                  tolerance: float = 1e-6) -> bool:
+    """
+    Compare equally sized blocks of lines, printing each mismatch.
+
+    Args:
+        first_line: 1-based line number of the first line in the block
+
+    Returns:
+        True if all lines in the block match
+    """
+    if len(lua_lines) > NUMPY_MIN_LINES:
+        mismatches = find_numeric_mismatches(lua_lines, cpp_lines, tolerance)
+        if mismatches is not None:
+            # Candidates only: identical inf/nan lines fail the tolerance
+            # check, so compare_lines decides and builds the message
+            all_match = True
+            for i in mismatches:
+                matches, message = compare_lines(lua_lines[i], cpp_lines[i], tolerance)
+                if not matches:
+                    print(f"Line {first_line + i}: {message}")
+                    all_match = False
+            return all_match
+
+    all_match = True
+    for i, (lua_line, cpp_line) in enumerate(zip(lua_lines, cpp_lines), first_line):
+        matches, message = compare_lines(lua_line, cpp_line, tolerance)
+        if not matches:
+            print(f"Line {i}: {message}")
+            all_match = False
+
+    return all_match
+
+
 def compare_files(lua_path: str, cpp_path: str, tolerance: float = 1e-6) -> bool:
     """
     Compare two output files.
+
+    Files are streamed in blocks of BLOCK_LINES, so memory use does not
+    grow with the output size.
     
     Returns:
         True if all lines match (within tolerance for numeric lines)
     """
     try:
-        with open(lua_path, 'r') as f:
-            lua_lines = f.readlines()
+        lua_file = open(lua_path, 'r')
     except FileNotFoundError:
         print(f"Error: Lua output file not found: {lua_path}")
         return False
     
     try:
-        with open(cpp_path, 'r') as f:
-            cpp_lines = f.readlines()
+        cpp_file = open(cpp_path, 'r')
     except FileNotFoundError:
+        lua_file.close()
         print(f"Error: C++ output file not found: {cpp_path}")
         return False
     
-    # Check line counts
-    if len(lua_lines) != len(cpp_lines):
-        print(f"Line count mismatch: Lua has {len(lua_lines)}, C++ has {len(cpp_lines)}")
-        return False
-    
     all_match = True
-    for i, (lua_line, cpp_line) in enumerate(zip(lua_lines, cpp_lines), 1):
-        matches, message = compare_lines(lua_line, cpp_line, tolerance)
-        if not matches:
-            print(f"Line {i}: {message}")
-            all_match = False
-    
-    return all_match
+    line_count = 0
+    with lua_file, cpp_file:
+        pairs = itertools.zip_longest(lua_file, cpp_file)
+        while True:
+            block = list(itertools.islice(pairs, BLOCK_LINES))
+            if not block:
+                return all_match
+
+            # zip_longest pads the shorter file with None
+            common = next((i for i, (lua_line, cpp_line) in enumerate(block)
+                           if lua_line is None or cpp_line is None), len(block))
+            lua_lines = [lua_line for lua_line, _ in block[:common]]
+            cpp_lines = [cpp_line for _, cpp_line in block[:common]]
+            if not compare_block(lua_lines, cpp_lines, line_count + 1, tolerance):
+                all_match = False
+            line_count += common
+
+            if common < len(block):
+                # Check line counts
+                lua_count = cpp_count = line_count
+                for lua_line, cpp_line in itertools.chain(block[common:], pairs):
+                    lua_count += lua_line is not None
+                    cpp_count += cpp_line is not None
+                print(f"Line count mismatch: Lua has {lua_count}, C++ has {cpp_count}")
+                return False
 
 
 def main():
@@ -13,6 +13,29 @@ import re
 import sys
 from pathlib import Path
 
+# Multiline template function header, e.g.:
+# template<typename q_t>
+# TABLE color(q_t q) { ...
+_TEMPLATE_FUNC_RE = re.compile(
+    r"template\s*<(?P<params>[^>]+)>\s*"  # template params
+    r"(?P<ret>[A-Za-z_][\w:\<\>\s&*]*?)\s+"  # return type
+    r"(?P<name>\w+)\s*"  # function name
+    r"\((?P<args>[^\)]*)\)\s*\{",  # parameter list and opening brace
+    re.MULTILINE | re.DOTALL,
+)
+
+# Tokens brace_map() stops at; everything in between is skipped
+_BRACE_SCAN_RE = re.compile(r"[{}\"']|//|/\*")
+
+# Closing quote of a string/char literal, skipping escaped characters
+_STRING_END_RE = {
+    '"': re.compile(r'(?:[^"\\\n]|\\.)*"'),
+    "'": re.compile(r"(?:[^'\\\n]|\\.)*'"),
+}
+
+# Template function passed by name, e.g. do_(color, "color")
+_LAMBDA_RE = re.compile(r"do_\(\s*(?P<name>\w+)\s*,\s*\"(?P<quoted>[^\"]+)\"\s*\)")
+
 
 def parse_param_names(param_list: str):
     """Return (param_decls, param_names) from a comma-separated list.
@@ -37,46 +60,61 @@ def parse_param_names(param_list: str):
     return decls, names
 
 
+def brace_map(code: str):
+    """Return a dict mapping each '{' position to its matching '}' position.
+    Braces inside // and /* */ comments and string/char literals are ignored.
+    Built in a single pass so each function end is an O(1) lookup.
+    """
+    matches = {}
+    stack = []
+    # Jump straight to the next brace, quote or comment start in C
+    m = _BRACE_SCAN_RE.search(code)
+    while m:
+        tok = m.group()
+        i = m.start()
+        if tok == '{':
+            stack.append(i)
+        elif tok == '}':
+            if stack:
+                matches[stack.pop()] = i
+        elif tok == '//':
+            i = code.find('\n', i)
+            if i == -1:
+                break
+        elif tok == '/*':
+            i = code.find('*/', i + 2)
+            if i == -1:
+                break
+            i += 1
+        else:
+            # Skip to the closing quote, stepping over escapes; an
+            # unterminated literal only skips the quote itself
+            end = _STRING_END_RE[tok].match(code, i + 1)
+            if end:
+                i = end.end() - 1
+        m = _BRACE_SCAN_RE.search(code, i + 1)
+    return matches
+
+
 def find_template_functions(code: str):
     """Yield tuples for template function definitions:
     (start_idx, end_idx, name, ret_type, template_params, param_decls, param_names)
     """
-    # Multiline template function header, e.g.:
-    # template<typename q_t>
-    # TABLE color(q_t q) { ...
-    pattern = re.compile(
-        r"template\s*<(?P<params>[^>]+)>\s*"  # template params
-        r"(?P<ret>[A-Za-z_][\w:\<\>\s&*]*?)\s+"  # return type
-        r"(?P<name>\w+)\s*"  # function name
-        r"\((?P<args>[^\)]*)\)\s*\{",  # parameter list and opening brace
-        re.MULTILINE | re.DOTALL,
-    )
-    for m in pattern.finditer(code):
+    braces = None
+    for m in _TEMPLATE_FUNC_RE.finditer(code):
+        if braces is None:
+            braces = brace_map(code)
         name = m.group('name')
         ret_type = m.group('ret').strip()
         template_params = m.group('params').strip()
         args = m.group('args').strip()
         decls, names = parse_param_names(args)
         # Determine the start (position of 'template...') and end of function body
-        # We locate the opening brace position and then balance braces to find end.
-        # Find the position of the opening brace following the match
+        # by looking up the brace that closes the one ending the match.
         brace_pos = code.find('{', m.end() - 1)
-        if brace_pos == -1:
-            continue
-        depth = 0
-        end_pos = brace_pos
-        i = brace_pos
-        while i < len(code):
-            ch = code[i]
-            if ch == '{':
-                depth += 1
-            elif ch == '}':
-                depth -= 1
-                if depth == 0:
-                    end_pos = i
-                    break
-            i += 1
-        else:
+        end_pos = braces.get(brace_pos)
+        if end_pos is None:
+            # Unbalanced, or the match sits inside a comment/string literal
             continue
         yield (m.start(), end_pos + 1, name, ret_type, template_params, decls, names,)
 
@@ -127,16 +165,22 @@ def fix(code: str) -> str:
             inserts.append((end, overload))
             fixed_names.add(name)
 
-    # Apply variadic overload inserts in reverse order to not corrupt indices
+    # Apply variadic overload inserts with a single join instead of
+    # re-slicing the whole source for each one
     if inserts:
-        inserts.sort(key=lambda x: x[0], reverse=True)
+        inserts.sort(key=lambda x: x[0])
+        parts = []
+        last = 0
         for pos, snippet in inserts:
-            code = code[:pos] + snippet + code[pos:]
+            parts.append(code[last:pos])
+            parts.append(snippet)
+            last = pos
+        parts.append(code[last:])
+        code = ''.join(parts)
 
     # Second pass: wrap template functions used as arguments (pattern: do_(NAME, "NAME"))
     # We replace occurrences with a lambda wrapper, and add a trailing marker comment.
     # Avoid multiple wrappings by simple in-place marker check.
-    lambda_pattern = re.compile(r"do_\(\s*(?P<name>\w+)\s*,\s*\"(?P<quoted>[^\"]+)\"\s*\)")
     def repl_lam(m):
         name = m.group('name')
         # if already wrapped, skip
@@ -146,7 +190,7 @@ def fix(code: str) -> str:
             return m.group(0)
         new = f'do_([&](auto&&... args) {{ return {name}(args...); }}, "{name}")'
         return new
-    code = lambda_pattern.sub(repl_lam, code)
+    code = _LAMBDA_RE.sub(repl_lam, code)
 
     return code
 
@@ -159,9 +203,10 @@ def main():
     if not p.exists():
         print(f"File not found: {p}")
         sys.exit(2)
-    code = p.read_text(encoding='utf-8')
+    # Bytes in and out: skips newline translation and the text-io layer
+    code = p.read_bytes().decode('utf-8')
     fixed = fix(code)
-    print(fixed, end='')
+    sys.stdout.buffer.write(fixed.encode('utf-8'))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,16 @@
+"""Shared pytest fixtures for the Python test suite"""
+
+import functools
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def parse_cache():
+    """ast.parse memoized by source, shared by every test module
+
+    Only hand the result to code that reads the tree, or roll back any
+    writes afterwards: the same Chunk is returned for identical sources.
+    """
+    from luaparser import ast
+    return functools.lru_cache(maxsize=None)(ast.parse)
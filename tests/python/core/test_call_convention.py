@@ -0,0 +1,51 @@
+"""Tests for call convention Index-chain helpers"""
+
+import pytest
+try:
+    from luaparser import ast
+    from lua2cpp.core.call_convention import flatten_index_chain_parts, get_root_module
+except ImportError:
+    pytest.skip("luaparser is required. Install with: pip install luaparser", allow_module_level=True)
+
+
+@pytest.fixture
+def expr(parse_cache):
+    """Parse `x = <source>` and return the right-hand expression"""
+    return lambda source: parse_cache(f"x = {source}").body.body[0].values[0]
+
+
+class TestIndexChainHelpers:
+    """Test suite for flatten_index_chain_parts and get_root_module"""
+
+    @pytest.mark.parametrize("source, parts", [
+        ("love", ["love"]),
+        ("math.sqrt", ["math", "sqrt"]),
+        ("love.timer.step", ["love", "timer", "step"]),
+        ('G["SETTINGS"].graphics', ["G", "SETTINGS", "graphics"]),
+    ])
+    def test_flatten_parts(self, source, parts, expr):
+        """Test chains flatten outermost-last"""
+        assert flatten_index_chain_parts(expr(source)) == parts
+
+    def test_flatten_skips_numeric_index(self, expr):
+        """Test non-name, non-string index keys are left out"""
+        assert flatten_index_chain_parts(expr("t[1].x")) == ["t", "x"]
+
+    @pytest.mark.parametrize("source, root", [
+        ("love", "love"),
+        ("love.timer.step", "love"),
+        ("f().x", ""),
+    ])
+    def test_root_module(self, source, root, expr):
+        """Test root module is the innermost Name, if any"""
+        assert get_root_module(expr(source)) == root
+
+    def test_long_chain(self, expr):
+        """Test helpers handle chains deeper than the recursion limit"""
+        import sys
+        depth = sys.getrecursionlimit() + 10
+        node = expr("a.b")
+        for _ in range(depth):
+            node = type(node)(node.idx, node)
+        assert get_root_module(node) == "a"
+        assert len(flatten_index_chain_parts(node)) == depth + 2
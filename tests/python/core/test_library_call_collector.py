@@ -13,12 +13,12 @@ except ImportError:
 
 
 class TestLibraryCallCollector:
-    def test_detect_io_write(self):
+    def test_detect_io_write(self, parse_cache):
         """Test that io.write() is detected as library function"""
         code = '''
 io.write('test')
 '''
-        chunk = ast.parse(code)
+        chunk = parse_cache(code)
         collector = LibraryCallCollector()
         collector.visit(chunk)
         calls = collector.get_library_calls()
@@ -28,12 +28,12 @@ io.write('test')
         assert calls[0].func == "write"
         assert calls[0].line == 2
 
-    def test_detect_math_sqrt(self):
+    def test_detect_math_sqrt(self, parse_cache):
         """Test that math.sqrt() is detected as library function"""
         code = '''
 math.sqrt(4)
 '''
-        chunk = ast.parse(code)
+        chunk = parse_cache(code)
         collector = LibraryCallCollector()
         collector.visit(chunk)
         calls = collector.get_library_calls()
@@ -43,12 +43,12 @@ math.sqrt(4)
         assert calls[0].func == "sqrt"
         assert calls[0].line == 2
 
-    def test_detect_string_format(self):
+    def test_detect_string_format(self, parse_cache):
         """Test that string.format() is detected as library function"""
         code = '''
 string.format('hello %s', 'world')
 '''
-        chunk = ast.parse(code)
+        chunk = parse_cache(code)
         collector = LibraryCallCollector()
         collector.visit(chunk)
         calls = collector.get_library_calls()
@@ -58,12 +58,12 @@ string.format('hello %s', 'world')
         assert calls[0].func == "format"
         assert calls[0].line == 2
 
-    def test_get_library_info(self):
+    def test_get_library_info(self, parse_cache):
         """Test that get_library_info() returns correct LibraryFunction"""
         code = '''
 io.write('test')
 '''
-        chunk = ast.parse(code)
+        chunk = parse_cache(code)
         collector = LibraryCallCollector()
         collector.visit(chunk)
         calls = collector.get_library_calls()
@@ -76,14 +76,14 @@ io.write('test')
         assert info.name == "write"
         assert info.return_type == TypeKind.BOOLEAN
 
-    def test_non_library_call(self):
+    def test_non_library_call(self, parse_cache):
         """Test that user-defined function is not detected as library"""
         code = '''
 function myfunc()
     return 42
 end
 '''
-        chunk = ast.parse(code)
+        chunk = parse_cache(code)
         collector = LibraryCallCollector()
         collector.visit(chunk)
         calls = collector.get_library_calls()
@@ -91,14 +91,14 @@ end
         # No calls should be detected (user function doesn't use Index notation)
         assert len(calls) == 0
 
-    def test_detect_global_functions(self):
+    def test_detect_global_functions(self, parse_cache):
         """Test that global function calls are detected as Name nodes"""
         code = '''
 print('hello')
 tonumber('123')
 tostring(42)
 '''
-        chunk = ast.parse(code)
+        chunk = parse_cache(code)
         collector = LibraryCallCollector()
         collector.visit(chunk)
         calls = collector.get_library_calls()
@@ -107,7 +107,7 @@ tostring(42)
         # LibraryCallCollector only detects Index-based calls like io.write()
         assert len(calls) == 0
 
-    def test_global_and_library_mixed(self):
+    def test_global_and_library_mixed(self, parse_cache):
         """Test that library calls are detected but global calls are not"""
         code = '''
 print('hello')
@@ -115,7 +115,7 @@ io.write('world')
 tonumber('123')
 math.sqrt(4)
 '''
-        chunk = ast.parse(code)
+        chunk = parse_cache(code)
         collector = LibraryCallCollector()
         collector.visit(chunk)
         calls = collector.get_library_calls()
@@ -126,13 +126,13 @@ math.sqrt(4)
         assert ("io", "write") in module_func_pairs
         assert ("math", "sqrt") in module_func_pairs
 
-    def test_variable_reference_not_global(self):
+    def test_variable_reference_not_global(self, parse_cache):
         """Test that variable references are not detected as library calls"""
         code = '''
 local f = print
 f('hello')
 '''
-        chunk = ast.parse(code)
+        chunk = parse_cache(code)
         collector = LibraryCallCollector()
         collector.visit(chunk)
         calls = collector.get_library_calls()
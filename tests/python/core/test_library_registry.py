@@ -1,10 +1,18 @@
 """Tests for library function registry"""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 from lua2cpp.core.library_registry import LibraryFunction, LibraryFunctionRegistry
 from lua2cpp.core.types import TypeKind
 
 
+@pytest.fixture(scope="module")
+def registry():
+    """Registry shared by read-only lookup tests"""
+    return LibraryFunctionRegistry()
+
+
 class TestLibraryFunction:
     """Test suite for LibraryFunction dataclass"""
 
@@ -20,13 +28,33 @@ class TestLibraryFunction:
         assert func.module == "io"
         assert func.name == "write"
         assert func.return_type == TypeKind.BOOLEAN
-        assert func.params == [TypeKind.STRING]
+        assert func.params == (TypeKind.STRING,)
         assert func.cpp_name == "io_write"
+        assert func.is_variadic is False
+
+    def test_is_variadic_derived_from_params(self):
+        """Test trailing VARIANT parameter marks function variadic"""
+        func = LibraryFunction("", "print", TypeKind.ANY, [TypeKind.VARIANT], "print")
+        assert func.is_variadic is True
+        assert LibraryFunction("io", "close", TypeKind.BOOLEAN, [], "io_close").is_variadic is False
 
 
 class TestLibraryFunctionRegistry:
     """Test suite for LibraryFunctionRegistry"""
 
+    def test_instances_share_definitions_not_tables(self):
+        """Test later registries reuse immutable definitions but own their tables"""
+        first = LibraryFunctionRegistry()
+        second = LibraryFunctionRegistry()
+        info = first.get_library_info("io", "write")
+        assert info is second.get_library_info("io", "write")
+        assert first._functions is not second._functions
+        assert first._functions["io"] is not second._functions["io"]
+        with pytest.raises(FrozenInstanceError):
+            info.cpp_name = "changed"
+        with pytest.raises(AttributeError):
+            info.params.append(TypeKind.STRING)
+
     def test_initialization(self):
         """Test registry initializes with all libraries"""
         registry = LibraryFunctionRegistry()
@@ -41,48 +69,41 @@ class TestLibraryFunctionRegistry:
         assert "debug" in modules
         assert "coroutine" in modules
 
-    def test_is_library_function_true(self):
+    def test_is_library_function_true(self, registry):
         """Test is_library_function returns True for valid functions"""
-        registry = LibraryFunctionRegistry()
         assert registry.is_library_function("io", "write")
         assert registry.is_library_function("string", "format")
         assert registry.is_library_function("math", "sqrt")
         assert registry.is_library_function("table", "insert")
 
-    def test_is_library_function_false_invalid_module(self):
+    def test_is_library_function_false_invalid_module(self, registry):
         """Test is_library_function returns False for invalid module"""
-        registry = LibraryFunctionRegistry()
         assert not registry.is_library_function("invalid_module", "write")
 
-    def test_is_library_function_false_invalid_function(self):
+    def test_is_library_function_false_invalid_function(self, registry):
         """Test is_library_function returns False for invalid function"""
-        registry = LibraryFunctionRegistry()
         assert not registry.is_library_function("io", "nonexistent_function")
 
-    def test_get_library_info_valid(self):
+    def test_get_library_info_valid(self, registry):
         """Test get_library_info returns correct function info"""
-        registry = LibraryFunctionRegistry()
         info = registry.get_library_info("io", "write")
         assert info is not None
         assert info.module == "io"
         assert info.name == "write"
         assert info.cpp_name == "io_write"
 
-    def test_get_library_info_none_invalid_module(self):
+    def test_get_library_info_none_invalid_module(self, registry):
         """Test get_library_info returns None for invalid module"""
-        registry = LibraryFunctionRegistry()
         info = registry.get_library_info("invalid_module", "write")
         assert info is None
 
-    def test_get_library_info_none_invalid_function(self):
+    def test_get_library_info_none_invalid_function(self, registry):
         """Test get_library_info returns None for invalid function"""
-        registry = LibraryFunctionRegistry()
         info = registry.get_library_info("io", "nonexistent_function")
         assert info is None
 
-    def test_is_standard_library_true(self):
+    def test_is_standard_library_true(self, registry):
         """Test is_standard_library returns True for standard libraries"""
-        registry = LibraryFunctionRegistry()
         assert registry.is_standard_library("io")
         assert registry.is_standard_library("string")
         assert registry.is_standard_library("math")
@@ -92,15 +113,13 @@ class TestLibraryFunctionRegistry:
         assert registry.is_standard_library("debug")
         assert registry.is_standard_library("coroutine")
 
-    def test_is_standard_library_false(self):
+    def test_is_standard_library_false(self, registry):
         """Test is_standard_library returns False for non-standard modules"""
-        registry = LibraryFunctionRegistry()
         assert not registry.is_standard_library("user_module")
         assert not registry.is_standard_library("my_lib")
 
-    def test_get_module_functions_valid_module(self):
+    def test_get_module_functions_valid_module(self, registry):
         """Test get_module_functions returns all functions in a module"""
-        registry = LibraryFunctionRegistry()
         io_funcs = registry.get_module_functions("io")
         assert len(io_funcs) > 0
         func_names = [f.name for f in io_funcs]
@@ -108,106 +127,30 @@ class TestLibraryFunctionRegistry:
         assert "read" in func_names
         assert "open" in func_names
 
-    def test_get_module_functions_invalid_module(self):
+    def test_get_module_functions_invalid_module(self, registry):
         """Test get_module_functions returns empty list for invalid module"""
-        registry = LibraryFunctionRegistry()
         funcs = registry.get_module_functions("nonexistent_module")
         assert funcs == []
 
-    def test_io_library_functions(self):
-        """Test io library has all expected functions"""
-        registry = LibraryFunctionRegistry()
-        funcs = registry.get_module_functions("io")
-        func_names = {f.name for f in funcs}
-        assert "close" in func_names
-        assert "flush" in func_names
-        assert "input" in func_names
-        assert "lines" in func_names
-        assert "open" in func_names
-        assert "output" in func_names
-        assert "popen" in func_names
-        assert "read" in func_names
-        assert "type" in func_names
-        assert "write" in func_names
-
-    def test_string_library_functions(self):
-        """Test string library has all expected functions"""
-        registry = LibraryFunctionRegistry()
-        funcs = registry.get_module_functions("string")
-        func_names = {f.name for f in funcs}
-        assert "byte" in func_names
-        assert "char" in func_names
-        assert "find" in func_names
-        assert "format" in func_names
-        assert "gsub" in func_names
-        assert "len" in func_names
-        assert "lower" in func_names
-        assert "upper" in func_names
-
-    def test_math_library_functions(self):
-        """Test math library has all expected functions"""
-        registry = LibraryFunctionRegistry()
-        funcs = registry.get_module_functions("math")
-        func_names = {f.name for f in funcs}
-        assert "abs" in func_names
-        assert "sqrt" in func_names
-        assert "sin" in func_names
-        assert "cos" in func_names
-        assert "random" in func_names
-        assert "floor" in func_names
-        assert "ceil" in func_names
-
-    def test_table_library_functions(self):
-        """Test table library has all expected functions"""
-        registry = LibraryFunctionRegistry()
-        funcs = registry.get_module_functions("table")
-        func_names = {f.name for f in funcs}
-        assert "concat" in func_names
-        assert "insert" in func_names
-        assert "remove" in func_names
-        assert "sort" in func_names
-
-    def test_os_library_functions(self):
-        """Test os library has all expected functions"""
-        registry = LibraryFunctionRegistry()
-        funcs = registry.get_module_functions("os")
-        func_names = {f.name for f in funcs}
-        assert "clock" in func_names
-        assert "date" in func_names
-        assert "execute" in func_names
-        assert "exit" in func_names
-
-    def test_package_library_functions(self):
-        """Test package library has all expected functions"""
-        registry = LibraryFunctionRegistry()
-        funcs = registry.get_module_functions("package")
-        func_names = {f.name for f in funcs}
-        assert "loadlib" in func_names
-        assert "searchpath" in func_names
-
-    def test_debug_library_functions(self):
-        """Test debug library has all expected functions"""
-        registry = LibraryFunctionRegistry()
-        funcs = registry.get_module_functions("debug")
-        func_names = {f.name for f in funcs}
-        assert "debug" in func_names
-        assert "getinfo" in func_names
-        assert "getlocal" in func_names
-        assert "traceback" in func_names
-
-    def test_coroutine_library_functions(self):
-        """Test coroutine library has all expected functions"""
-        registry = LibraryFunctionRegistry()
-        funcs = registry.get_module_functions("coroutine")
-        func_names = {f.name for f in funcs}
-        assert "create" in func_names
-        assert "resume" in func_names
-        assert "yield" in func_names
-        assert "status" in func_names
-
-    def test_function_cpp_name_format(self):
+    @pytest.mark.parametrize("module, expected", [
+        ("io", {"close", "flush", "input", "lines", "open", "output",
+                "popen", "read", "type", "write"}),
+        ("string", {"byte", "char", "find", "format", "gsub", "len",
+                    "lower", "upper"}),
+        ("math", {"abs", "sqrt", "sin", "cos", "random", "floor", "ceil"}),
+        ("table", {"concat", "insert", "remove", "sort"}),
+        ("os", {"clock", "date", "execute", "exit"}),
+        ("package", {"loadlib", "searchpath"}),
+        ("debug", {"debug", "getinfo", "getlocal", "traceback"}),
+        ("coroutine", {"create", "resume", "yield", "status"}),
+    ])
+    def test_library_functions(self, registry, module, expected):
+        """Test each library has all expected functions"""
+        func_names = {f.name for f in registry.get_module_functions(module)}
+        assert expected <= func_names, expected - func_names
+
+    def test_function_cpp_name_format(self, registry):
         """Test cpp_name follows expected format"""
-        registry = LibraryFunctionRegistry()
         info = registry.get_library_info("io", "write")
         assert info.cpp_name == "io_write"
 
@@ -217,18 +160,16 @@ class TestLibraryFunctionRegistry:
         info = registry.get_library_info("string", "format")
         assert info.cpp_name == "string_format"
 
-    def test_all_functions_have_valid_cpp_names(self):
+    def test_all_functions_have_valid_cpp_names(self, registry):
         """Test all registered functions have cpp_name following convention"""
-        registry = LibraryFunctionRegistry()
         for module in registry.get_all_modules():
             funcs = registry.get_module_functions(module)
             for func in funcs:
                 assert func.cpp_name.startswith(module + "_")
                 assert func.name in func.cpp_name
 
-    def test_function_return_types(self):
+    def test_function_return_types(self, registry):
         """Test functions have appropriate return types"""
-        registry = LibraryFunctionRegistry()
         info = registry.get_library_info("io", "write")
         assert info.return_type == TypeKind.BOOLEAN
 
@@ -238,20 +179,18 @@ class TestLibraryFunctionRegistry:
         info = registry.get_library_info("math", "sqrt")
         assert info.return_type == TypeKind.NUMBER
 
-    def test_library_function_fields(self):
+    def test_library_function_fields(self, registry):
         """Test LibraryFunction has all required fields"""
-        registry = LibraryFunctionRegistry()
         info = registry.get_library_info("io", "write")
         assert hasattr(info, "module")
         assert hasattr(info, "name")
         assert hasattr(info, "return_type")
         assert hasattr(info, "params")
         assert hasattr(info, "cpp_name")
-        assert isinstance(info.params, list)
+        assert isinstance(info.params, tuple)
 
-    def test_global_functions_registered(self):
+    def test_global_functions_registered(self, registry):
         """Test that all 18 global functions are registered"""
-        registry = LibraryFunctionRegistry()
 
         # Test all global functions are registered
         global_functions = [
@@ -264,9 +203,8 @@ class TestLibraryFunctionRegistry:
             assert registry.is_global_function(func_name), \
                 f"Global function '{func_name}' should be registered"
 
-    def test_global_function_info_module(self):
+    def test_global_function_info_module(self, registry):
         """Test that global functions have empty string as module"""
-        registry = LibraryFunctionRegistry()
 
         global_functions = ["print", "tonumber", "tostring"]
 
@@ -275,9 +213,8 @@ class TestLibraryFunctionRegistry:
             assert info is not None, f"Global function '{func_name}' should have info"
             assert info.module == "", f"Global function '{func_name}' module should be empty string"
 
-    def test_global_function_info_structure(self):
+    def test_global_function_info_structure(self, registry):
         """Test that global function info has correct structure"""
-        registry = LibraryFunctionRegistry()
         info = registry.get_global_info("print")
 
         assert info is not None
@@ -287,15 +224,13 @@ class TestLibraryFunctionRegistry:
         assert hasattr(info, "return_type")
         assert hasattr(info, "params")
 
-    def test_is_global_function_false_for_library(self):
+    def test_is_global_function_false_for_library(self, registry):
         """Test that is_global_function returns False for library functions"""
-        registry = LibraryFunctionRegistry()
 
         # io.write is a library function, not a global
         assert not registry.is_global_function("io"), "Module name should not be global function"
 
-    def test_get_global_info_none_for_unknown(self):
+    def test_get_global_info_none_for_unknown(self, registry):
         """Test that get_global_info returns None for unknown function"""
-        registry = LibraryFunctionRegistry()
         info = registry.get_global_info("unknown_global_function")
         assert info is None
@@ -13,8 +13,6 @@ Test Coverage:
 """
 
 import pytest
-import tempfile
-from pathlib import Path
 
 try:
     from luaparser import ast
@@ -24,10 +22,20 @@ except ImportError:
 from lua2cpp.generators.cpp_emitter import CppEmitter
 
 
+@pytest.fixture(scope="module")
+def lua_dir(tmp_path_factory):
+    """One scratch directory for the module's Lua source files
+
+    Tests may reuse a file name: generate_file takes the chunk and only
+    uses the path for naming, never the file contents.
+    """
+    return tmp_path_factory.mktemp("lua")
+
+
 class TestArgDetection:
     """Test arg detection logic for vararg handling"""
 
-    def test_arg_detected_when_used(self):
+    def test_arg_detected_when_used(self, lua_dir):
         """Test that arg is detected when used in Lua code
 
         Lua code:
@@ -40,19 +48,18 @@ class TestArgDetection:
         chunk = ast.parse(lua_code)
         assert chunk is not None
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            lua_file = Path(tmpdir) / 'simple.lua'
-            lua_file.write_text(lua_code)
+        lua_file = lua_dir / 'simple.lua'
+        lua_file.write_text(lua_code)
 
-            emitter = CppEmitter()
-            cpp_code = emitter.generate_file(chunk, lua_file)
+        emitter = CppEmitter()
+        cpp_code = emitter.generate_file(chunk, lua_file)
 
-            assert 'TABLE arg' in cpp_code, \
-                "Generated code should have TABLE arg parameter when Lua uses arg"
-            assert 'simple_module_init(' in cpp_code, \
-                "Module init function should be named simple_module_init"
+        assert 'TABLE arg' in cpp_code, \
+            "Generated code should have TABLE arg parameter when Lua uses arg"
+        assert 'simple_module_init(' in cpp_code, \
+            "Module init function should be named simple_module_init"
 
-    def test_arg_not_detected_when_unused(self):
+    def test_arg_not_detected_when_unused(self, lua_dir):
         """Test that arg is NOT added when not used in Lua code
 
         Lua code:
@@ -66,19 +73,18 @@ class TestArgDetection:
         chunk = ast.parse(lua_code)
         assert chunk is not None
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            lua_file = Path(tmpdir) / 'simple.lua'
-            lua_file.write_text(lua_code)
+        lua_file = lua_dir / 'simple.lua'
+        lua_file.write_text(lua_code)
 
-            emitter = CppEmitter()
-            cpp_code = emitter.generate_file(chunk, lua_file)
+        emitter = CppEmitter()
+        cpp_code = emitter.generate_file(chunk, lua_file)
 
-            assert 'TABLE arg' not in cpp_code, \
-                "Generated code should NOT have TABLE arg parameter when Lua does not use arg"
-            assert 'simple_module_init(' in cpp_code, \
-                "Module init function should be named simple_module_init"
+        assert 'TABLE arg' not in cpp_code, \
+            "Generated code should NOT have TABLE arg parameter when Lua does not use arg"
+        assert 'simple_module_init(' in cpp_code, \
+            "Module init function should be named simple_module_init"
 
-    def test_arg_ignored_when_explicit_param(self):
+    def test_arg_ignored_when_explicit_param(self, lua_dir):
         """Test that arg is ignored when declared as explicit function parameter
 
         Lua code:
@@ -99,19 +105,18 @@ return foo(42)
         chunk = ast.parse(lua_code)
         assert chunk is not None
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            lua_file = Path(tmpdir) / 'foo.lua'
-            lua_file.write_text(lua_code)
+        lua_file = lua_dir / 'foo.lua'
+        lua_file.write_text(lua_code)
 
-            emitter = CppEmitter()
-            cpp_code = emitter.generate_file(chunk, lua_file)
+        emitter = CppEmitter()
+        cpp_code = emitter.generate_file(chunk, lua_file)
 
-            assert 'TABLE arg' not in cpp_code, \
-                "Generated code should NOT have TABLE arg parameter when arg is a function parameter"
-            assert 'foo_module_init(' in cpp_code, \
-                "Module init function should be named foo_module_init"
+        assert 'TABLE arg' not in cpp_code, \
+            "Generated code should NOT have TABLE arg parameter when arg is a function parameter"
+        assert 'foo_module_init(' in cpp_code, \
+            "Module init function should be named foo_module_init"
 
-    def test_arg_ignored_when_local_shadowing(self):
+    def test_arg_ignored_when_local_shadowing(self, lua_dir):
         """Test that arg is ignored when shadowed by local variable
 
         Lua code:
@@ -125,23 +130,22 @@ return foo(42)
         chunk = ast.parse(lua_code)
         assert chunk is not None
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            lua_file = Path(tmpdir) / 'simple.lua'
-            lua_file.write_text(lua_code)
+        lua_file = lua_dir / 'simple.lua'
+        lua_file.write_text(lua_code)
 
-            emitter = CppEmitter()
-            cpp_code = emitter.generate_file(chunk, lua_file)
+        emitter = CppEmitter()
+        cpp_code = emitter.generate_file(chunk, lua_file)
 
-            assert 'TABLE arg' not in cpp_code, \
-                "Generated code should NOT have TABLE arg parameter when arg is a local variable"
-            assert 'simple_module_init(' in cpp_code, \
-                "Module init function should be named simple_module_init"
+        assert 'TABLE arg' not in cpp_code, \
+            "Generated code should NOT have TABLE arg parameter when arg is a local variable"
+        assert 'simple_module_init(' in cpp_code, \
+            "Module init function should be named simple_module_init"
 
 
 class TestModuleInitNaming:
     """Test module_init function naming and filename sanitization"""
 
-    def test_module_init_naming_simple(self):
+    def test_module_init_naming_simple(self, lua_dir):
         """Test module_init naming for simple filename
 
         Filename: simple.lua
@@ -151,17 +155,16 @@ class TestModuleInitNaming:
         chunk = ast.parse(lua_code)
         assert chunk is not None
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            lua_file = Path(tmpdir) / 'simple.lua'
-            lua_file.write_text(lua_code)
+        lua_file = lua_dir / 'simple.lua'
+        lua_file.write_text(lua_code)
 
-            emitter = CppEmitter()
-            cpp_code = emitter.generate_file(chunk, lua_file)
+        emitter = CppEmitter()
+        cpp_code = emitter.generate_file(chunk, lua_file)
 
-            assert 'simple_module_init(' in cpp_code, \
-                "Module init function should be named simple_module_init for simple.lua"
+        assert 'simple_module_init(' in cpp_code, \
+            "Module init function should be named simple_module_init for simple.lua"
 
-    def test_module_init_naming_sanitized(self):
+    def test_module_init_naming_sanitized(self, lua_dir):
         """Test module_init naming with sanitized special characters
 
         Filename: my-file.lua
@@ -171,17 +174,16 @@ class TestModuleInitNaming:
         chunk = ast.parse(lua_code)
         assert chunk is not None
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            lua_file = Path(tmpdir) / 'my-file.lua'
-            lua_file.write_text(lua_code)
+        lua_file = lua_dir / 'my-file.lua'
+        lua_file.write_text(lua_code)
 
-            emitter = CppEmitter()
-            cpp_code = emitter.generate_file(chunk, lua_file)
+        emitter = CppEmitter()
+        cpp_code = emitter.generate_file(chunk, lua_file)
 
-            assert 'my_file_module_init(' in cpp_code, \
-                "Module init function should sanitize dashes to underscores"
+        assert 'my_file_module_init(' in cpp_code, \
+            "Module init function should sanitize dashes to underscores"
 
-    def test_module_init_naming_extension(self):
+    def test_module_init_naming_extension(self, lua_dir):
         """Test module_init naming strips .lua extension
 
         Filename: test.lua
@@ -191,19 +193,18 @@ class TestModuleInitNaming:
         chunk = ast.parse(lua_code)
         assert chunk is not None
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            lua_file = Path(tmpdir) / 'test.lua'
-            lua_file.write_text(lua_code)
+        lua_file = lua_dir / 'test.lua'
+        lua_file.write_text(lua_code)
 
-            emitter = CppEmitter()
-            cpp_code = emitter.generate_file(chunk, lua_file)
+        emitter = CppEmitter()
+        cpp_code = emitter.generate_file(chunk, lua_file)
 
-            assert 'test_module_init(' in cpp_code, \
-                "Module init function should be named test_module_init"
-            assert 'test.lua_module_init' not in cpp_code, \
-                "Module init function name should not contain .lua extension"
+        assert 'test_module_init(' in cpp_code, \
+            "Module init function should be named test_module_init"
+        assert 'test.lua_module_init' not in cpp_code, \
+            "Module init function name should not contain .lua extension"
 
-    def test_module_init_no_arg_when_unused(self):
+    def test_module_init_no_arg_when_unused(self, lua_dir):
         """Test module_init has no TABLE arg parameter when arg is not used
 
         Filename: simple.lua
@@ -214,20 +215,14 @@ class TestModuleInitNaming:
         chunk = ast.parse(lua_code)
         assert chunk is not None
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.lua', delete=False,
-                                         prefix='simple_') as f:
-            f.write(lua_code)
-            f.flush()
-            lua_file = Path(f.name)
+        lua_file = lua_dir / 'simple_unused.lua'
+        lua_file.write_text(lua_code)
 
-        try:
-            emitter = CppEmitter()
-            cpp_code = emitter.generate_file(chunk, lua_file)
+        emitter = CppEmitter()
+        cpp_code = emitter.generate_file(chunk, lua_file)
 
-            assert 'TABLE arg' not in cpp_code, \
-                "Module init function should NOT have TABLE arg parameter when arg is not used"
+        assert 'TABLE arg' not in cpp_code, \
+            "Module init function should NOT have TABLE arg parameter when arg is not used"
 
-            assert '_module_init(' in cpp_code, \
-                "Module init function should exist"
-        finally:
-            lua_file.unlink()
+        assert '_module_init(' in cpp_code, \
+            "Module init function should exist"
@@ -7,6 +7,9 @@ Tests all 20 Lua test files from tests/cpp/lua/ to ensure:
 """
 
 import os
+import pickle
+import hashlib
+import importlib.metadata
 import pytest
 from pathlib import Path
 from luaparser import ast
@@ -44,6 +47,50 @@ LUA_TEST_FILES = [
 ]
 
 
+# Opt-in on-disk AST cache shared between pytest runs (LUA2CPP_TEST_AST_CACHE=1)
+AST_CACHE_DIR = Path(__file__).parent.parent.parent.parent / ".pytest_cache" / "lua2cpp" / "ast"
+
+
+def _ast_cache_path(source: bytes) -> Path:
+    """Cache file for a source; the luaparser version is part of the key"""
+    digest = hashlib.blake2b(source, digest_size=16)
+    digest.update(importlib.metadata.version("luaparser").encode())
+    return AST_CACHE_DIR / f"{digest.hexdigest()}.pickle"
+
+
+def load_lua_chunk(filename: str, parse_cache):
+    """Parse a Lua test file once and share the AST across tests
+
+    Only for tests that do not mutate the AST (type resolution annotates nodes).
+
+    Args:
+        filename: Name of the Lua file in LUA_TEST_DIR
+        parse_cache: Session-wide memoized ast.parse (conftest fixture)
+
+    Returns:
+        Parsed luaparser Chunk
+    """
+    source = (LUA_TEST_DIR / filename).read_bytes()
+    if not os.environ.get("LUA2CPP_TEST_AST_CACHE"):
+        return parse_cache(source.decode('utf-8'))
+
+    cache_path = _ast_cache_path(source)
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    chunk = parse_cache(source.decode('utf-8'))
+    AST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # Write then rename so parallel workers never read a partial file
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(chunk, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+    return chunk
+
+
 def create_type_resolver() -> TypeResolver:
     """Create a TypeResolver instance with required dependencies
 
@@ -61,7 +108,7 @@ class TestLuaFilesIntegration:
     """Integration tests for all 20 Lua test files"""
 
     @pytest.mark.parametrize("filename", LUA_TEST_FILES)
-    def test_lua_file_parses_successfully(self, filename):
+    def test_lua_file_parses_successfully(self, filename, parse_cache):
         """Test that all 20 Lua files parse successfully
 
         Args:
@@ -70,10 +117,7 @@ class TestLuaFilesIntegration:
         filepath = LUA_TEST_DIR / filename
         assert filepath.exists(), f"Lua test file not found: {filepath}"
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lua_code = f.read()
-
-        chunk = ast.parse(lua_code)
+        chunk = load_lua_chunk(filename, parse_cache)
         assert chunk is not None, f"Failed to parse {filename}"
         assert hasattr(chunk, 'body'), f"Chunk has no body: {filename}"
 
@@ -98,7 +142,7 @@ class TestLuaFilesIntegration:
         # Empty inferred_types is acceptable (some files have no types to infer)
 
     @pytest.mark.parametrize("filename", LUA_TEST_FILES)
-    def test_lua_file_has_valid_ast_structure(self, filename):
+    def test_lua_file_has_valid_ast_structure(self, filename, parse_cache):
         """Test that all parsed files have valid AST structure
 
         Args:
@@ -107,10 +151,7 @@ class TestLuaFilesIntegration:
         filepath = LUA_TEST_DIR / filename
         assert filepath.exists(), f"Lua test file not found: {filepath}"
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lua_code = f.read()
-
-        chunk = ast.parse(lua_code)
+        chunk = load_lua_chunk(filename, parse_cache)
         assert chunk is not None
         assert hasattr(chunk, 'body')
         assert hasattr(chunk.body, 'body')
@@ -1,5 +1,7 @@
 """Tests for AST visitor"""
 
+from collections import defaultdict
+
 import pytest
 from lua2cpp.core.ast_visitor import ASTVisitor
 
@@ -14,89 +16,114 @@ class CountingVisitor(ASTVisitor):
 
     def __init__(self) -> None:
         super().__init__()
-        self.counts: dict = {}
+        self.counts: defaultdict = defaultdict(int)
         self.names: list = []
 
     def visit_Name(self, node) -> None:
         """Count Name nodes and collect identifiers"""
-        node_type = node.__class__.__name__
-        self.counts[node_type] = self.counts.get(node_type, 0) + 1
+        self.counts["Name"] += 1
         self.names.append(node.id)
         self.generic_visit(node)
 
     def visit_Number(self, node) -> None:
         """Count Number nodes"""
-        node_type = node.__class__.__name__
-        self.counts[node_type] = self.counts.get(node_type, 0) + 1
+        self.counts["Number"] += 1
         self.generic_visit(node)
 
     def visit_String(self, node) -> None:
         """Count String nodes"""
-        node_type = node.__class__.__name__
-        self.counts[node_type] = self.counts.get(node_type, 0) + 1
+        self.counts["String"] += 1
         self.generic_visit(node)
 
     def visit_Function(self, node) -> None:
         """Count Function nodes"""
-        node_type = node.__class__.__name__
-        self.counts[node_type] = self.counts.get(node_type, 0) + 1
+        self.counts["Function"] += 1
         self.generic_visit(node)
 
     def visit_AnonymousFunction(self, node) -> None:
         """Count AnonymousFunction nodes"""
-        node_type = node.__class__.__name__
-        self.counts[node_type] = self.counts.get(node_type, 0) + 1
+        self.counts["AnonymousFunction"] += 1
         self.generic_visit(node)
 
 
 class TestASTVisitor:
     """Test suite for ASTVisitor"""
 
-    def test_basic_traversal(self):
+    def test_basic_traversal(self, parse_cache):
         """Test basic AST traversal"""
         src = """
         local x = 10
         local y = x + 5
         """
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
         assert visitor.counts.get("Name", 0) >= 2
         assert visitor.counts.get("Number", 0) >= 2
 
+    def test_dispatch_is_per_visitor_class(self, parse_cache):
+        """Test dispatch respects subclass overrides"""
+        class NumberOnlyVisitor(CountingVisitor):
+            def visit_Name(self, node) -> None:
+                pass
+
+        tree = parse_cache("local a = 42")
+        base = CountingVisitor()
+        base.visit(tree)
+        derived = NumberOnlyVisitor()
+        derived.visit(tree)
+
+        assert base.names == ["a"]
+        assert derived.names == []
+        assert derived.counts.get("Number", 0) == 1
+
+    def test_dispatch_honours_instance_attributes(self, parse_cache):
+        """Test a visit_* patched onto one instance is used for that instance"""
+        tree = parse_cache("local a = 42")
+        seen = []
+        patched = CountingVisitor()
+        patched.visit_Name = seen.append
+        patched.visit(tree)
+        plain = CountingVisitor()
+        plain.visit(tree)
+
+        assert [node.id for node in seen] == ["a"]
+        assert patched.names == []
+        assert plain.names == ["a"]
+
     def test_function_detection(self):
         """Test function scope detection"""
         visitor = ASTVisitor()
         assert visitor.in_function is False
 
-    def test_simple_assignment(self):
+    def test_simple_assignment(self, parse_cache):
         """Test simple assignment parsing and traversal"""
         src = "local a = 42"
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
         assert "a" in visitor.names
         assert visitor.counts.get("Number", 0) == 1
 
-    def test_string_literal(self):
+    def test_string_literal(self, parse_cache):
         """Test string literal traversal"""
         src = 'local msg = "hello world"'
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
         assert visitor.counts.get("String", 0) == 1
 
-    def test_function_definition(self):
+    def test_function_definition(self, parse_cache):
         """Test function definition traversal"""
         src = """
         local function add(a, b)
           return a + b
         end
         """
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
@@ -104,12 +131,12 @@ class TestASTVisitor:
         assert "a" in visitor.names
         assert "b" in visitor.names
 
-    def test_anonymous_function(self):
+    def test_anonymous_function(self, parse_cache):
         """Test anonymous function traversal"""
         src = """
         local f = function(x) return x * 2 end
         """
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
@@ -117,7 +144,7 @@ class TestASTVisitor:
         assert "x" in visitor.names
         assert visitor.counts.get("AnonymousFunction", 0) == 1
 
-    def test_if_statement(self):
+    def test_if_statement(self, parse_cache):
         """Test if statement traversal"""
         src = """
         if x > 0 then
@@ -126,47 +153,47 @@ class TestASTVisitor:
           print("non-positive")
         end
         """
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
         assert "x" in visitor.names
         assert visitor.counts.get("String", 0) >= 1
 
-    def test_while_loop(self):
+    def test_while_loop(self, parse_cache):
         """Test while loop traversal"""
         src = """
         while i < 10 do
           i = i + 1
         end
         """
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
         assert "i" in visitor.names
 
-    def test_for_loop(self):
+    def test_for_loop(self, parse_cache):
         """Test numeric for loop traversal"""
         src = """
         for i = 1, 10, 1 do
           print(i)
         end
         """
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
         assert "i" in visitor.names
 
-    def test_for_in_loop(self):
+    def test_for_in_loop(self, parse_cache):
         """Test for-in loop traversal"""
         src = """
         for k, v in pairs(t) do
           print(k, v)
         end
         """
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
@@ -174,26 +201,26 @@ class TestASTVisitor:
         assert "v" in visitor.names
         assert "t" in visitor.names
 
-    def test_table_constructor(self):
+    def test_table_constructor(self, parse_cache):
         """Test table constructor traversal"""
         src = "local t = {1, 2, 3}"
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
         assert visitor.counts.get("Number", 0) >= 3
 
-    def test_method_call(self):
+    def test_method_call(self, parse_cache):
         """Test method call (colon syntax) traversal"""
         src = "object:method(arg)"
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
         assert "object" in visitor.names
         assert "arg" in visitor.names
 
-    def test_nested_functions(self):
+    def test_nested_functions(self, parse_cache):
         """Test nested function traversal"""
         src = """
         local function outer()
@@ -203,45 +230,45 @@ class TestASTVisitor:
           return inner()
         end
         """
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
         assert "outer" in visitor.names
         assert "inner" in visitor.names
 
-    def test_return_statement(self):
+    def test_return_statement(self, parse_cache):
         """Test return statement traversal"""
         src = """
         function foo()
           return 1, 2, 3
         end
         """
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
         assert visitor.counts.get("Number", 0) >= 3
 
-    def test_break_statement(self):
+    def test_break_statement(self, parse_cache):
         """Test break statement in loop"""
         src = """
         while true do
           break
         end
         """
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
-    def test_nil_and_boolean(self):
+    def test_nil_and_boolean(self, parse_cache):
         """Test nil and boolean values"""
         src = """
         local a = nil
         local b = true
         local c = false
         """
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
@@ -249,7 +276,7 @@ class TestASTVisitor:
         assert "b" in visitor.names
         assert "c" in visitor.names
 
-    def test_binary_operations(self):
+    def test_binary_operations(self, parse_cache):
         """Test various binary operations"""
         src = """
         local a = x + y
@@ -265,34 +292,34 @@ class TestASTVisitor:
         local k = x > y
         local l = x >= y
         """
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
         assert "x" in visitor.names
         assert "y" in visitor.names
 
-    def test_unary_operations(self):
+    def test_unary_operations(self, parse_cache):
         """Test unary operations"""
         src = """
         local a = -x
         local b = not x
         local c = #x
         """
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
         assert visitor.names.count("x") >= 3
 
-    def test_table_access(self):
+    def test_table_access(self, parse_cache):
         """Test table field access"""
         src = """
         local x = t.field
         local y = t["key"]
         local z = t[1]
         """
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
@@ -301,10 +328,10 @@ class TestASTVisitor:
         assert "y" in visitor.names
         assert "z" in visitor.names
 
-    def test_multiple_assignment(self):
+    def test_multiple_assignment(self, parse_cache):
         """Test multiple assignment"""
         src = "local a, b, c = 1, 2, 3"
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
@@ -313,32 +340,32 @@ class TestASTVisitor:
         assert "c" in visitor.names
         assert visitor.counts.get("Number", 0) >= 3
 
-    def test_varargs(self):
+    def test_varargs(self, parse_cache):
         """Test varargs (...)"""
         src = """
         function foo(...)
           return ...
         end
         """
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
         assert "foo" in visitor.names
 
-    def test_comments_ignored(self):
+    def test_comments_ignored(self, parse_cache):
         """Test that comments are ignored in traversal"""
         src = """
         -- This is a comment
         local x = 42  -- inline comment
         """
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
         assert "x" in visitor.names
 
-    def test_generic_visit_children(self):
+    def test_generic_visit_children(self, parse_cache):
         """Test that generic_visit visits all children"""
         src = """
         local function test(a, b, c)
@@ -349,7 +376,7 @@ class TestASTVisitor:
           end
         end
         """
-        tree = ast.parse(src)
+        tree = parse_cache(src)
         visitor = CountingVisitor()
         visitor.visit(tree)
 
@@ -0,0 +1,48 @@
+"""Tests for scripts/compare_output.py"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).parent.parent.parent / "scripts" / "compare_output.py"
+_spec = importlib.util.spec_from_file_location("compare_output", _SCRIPT)
+compare_output = importlib.util.module_from_spec(_spec)
+# Registered first so numba's on-disk cache can re-import the module
+sys.modules["compare_output"] = compare_output
+_spec.loader.exec_module(compare_output)
+
+
+class TestCompareBlock:
+    """Test compare_block on blocks large enough for the vectorized path"""
+
+    def test_identical_inf_nan_lines_match(self, capsys):
+        """Test identical inf/nan lines are not reported as mismatches"""
+        lines = ["1.0\n"] * 1500 + ["inf\n", "nan\n"]
+        assert compare_output.compare_block(lines, list(lines), 1)
+        assert capsys.readouterr().out == ""
+
+    def test_out_of_tolerance_line_reported(self, capsys):
+        """Test a real numeric mismatch is still reported by line number"""
+        lua_lines = ["1.0\n"] * 1500
+        cpp_lines = list(lua_lines)
+        cpp_lines[1200] = "2.0\n"
+        assert not compare_output.compare_block(lua_lines, cpp_lines, 1)
+        assert capsys.readouterr().out.startswith("Line 1201: Out of tolerance")
+
+    @pytest.mark.parametrize("lua_line, cpp_line", [
+        ("1_0\n", "10\n"),
+        ("1.0\n", " 1.0 \n"),
+        ("nan\n", "nan\n"),
+        ("infinity\n", "inf\n"),
+        ("1.0\n", "1.5\n"),
+    ])
+    def test_vectorized_path_agrees_with_per_line(self, monkeypatch, lua_line, cpp_line):
+        """Test blocks above and below NUMPY_MIN_LINES give the same result"""
+        lua_lines = ["1.0\n"] * 1500 + [lua_line]
+        cpp_lines = ["1.0\n"] * 1500 + [cpp_line]
+        vectorized = compare_output.compare_block(lua_lines, cpp_lines, 1)
+        monkeypatch.setattr(compare_output, "NUMPY_MIN_LINES", len(lua_lines))
+        per_line = compare_output.compare_block(lua_lines, cpp_lines, 1)
+        assert vectorized == per_line
@@ -61,6 +61,29 @@ class TestFunctionSignatureRegistry:
         assert registry.get_signature("foo") == new_signature
         assert registry.get_signature("foo").param_names == ["a", "b", "c"]
 
+    def test_register_many(self):
+        """Test batch registration matches per-function registration"""
+        registry = FunctionSignatureRegistry()
+
+        created = registry.register_many([
+            ("foo", ["x", "y"], True),
+            ("bar", [], False),
+        ])
+
+        assert [sig.name for sig in created] == ["foo", "bar"]
+        assert registry.get_signature("foo").param_names == ["x", "y"]
+        assert registry.get_signature("bar").is_local is False
+        assert registry.call_graph == {"foo": [], "bar": []}
+
+    def test_register_many_rejects_duplicates_atomically(self):
+        """Test an invalid spec leaves the registry untouched"""
+        registry = FunctionSignatureRegistry()
+
+        with pytest.raises(ValueError, match="duplicate parameter"):
+            registry.register_many([("foo", ["x"], True), ("bar", ["y", "y"], True)])
+
+        assert registry.has_function("foo") is False
+
     def test_has_function(self):
         """Test checking if function exists in registry"""
         registry = FunctionSignatureRegistry()
@@ -350,6 +373,12 @@ class TestCallSiteInfo:
         assert call_site.get_arg_symbol(-1) is None
         assert call_site.get_arg_symbol(5) is None
 
+    def test_call_site_has_slots(self):
+        """Test that CallSiteInfo instances carry no __dict__"""
+        call_site = CallSiteInfo(caller_name="main", arg_symbols=["arg1"])
+
+        assert not hasattr(call_site, '__dict__')
+
 
 class TestFunctionSignature:
     """Test FunctionSignature dataclass"""
@@ -394,6 +423,14 @@ class TestFunctionSignature:
         assert signature.has_param_info(0) is True
         assert signature.has_param_info(1) is False
 
+    def test_param_table_info_sized_to_params(self):
+        """Test parameter info storage has one slot per parameter"""
+        signature = FunctionSignature(name="foo", param_names=["a", "b", "c"])
+
+        assert signature.param_table_info == [None, None, None]
+        assert signature.has_param_info(3) is False
+        assert signature.has_param_info(-1) is False
+
     def test_get_all_call_sites(self):
         """Test getting all call sites"""
         signature = FunctionSignature(name="foo", param_names=["x"])
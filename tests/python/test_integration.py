@@ -21,6 +21,10 @@ from lua2cpp.generators.cpp_emitter import CppEmitter
 from lua2cpp.cli.main import transpile_file
 
 
+# Tests share tests/cpp/generated and the build dir; keep them on one xdist worker.
+# Every test shells out to g++, so the module is opt-in via -m slow.
+pytestmark = [pytest.mark.xdist_group("cpp_build"), pytest.mark.slow]
+
 LUA_TEST_DIR = Path(__file__).parent.parent.parent / "tests" / "cpp" / "lua"
 GENERATED_DIR = Path(__file__).parent.parent.parent / "tests" / "cpp" / "generated"
 
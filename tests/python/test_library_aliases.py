@@ -3,6 +3,7 @@
 
 import sys
 import os
+import traceback
 sys.path.insert(0, '/home/bober/Documents/ProgrammingProjects/Python/lua2c')
 sys.path.insert(0, '/home/bober/.local/lib/python3.14/site-packages')
 
@@ -164,6 +165,5 @@ if __name__ == "__main__":
         print("\n✓ All tests passed!")
     except Exception as e:
         print(f"\n✗ Test failed: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
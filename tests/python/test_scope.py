@@ -33,6 +33,13 @@ class TestSymbol:
         assert "scope_id=789" in repr_str
         assert "is_global=True" in repr_str
 
+    def test_symbol_uses_slots(self):
+        """Test symbol has no per-instance __dict__"""
+        symbol = Symbol("x", 1)
+        assert not hasattr(symbol, "__dict__")
+        with pytest.raises(AttributeError):
+            symbol.extra = 1
+
 
 class TestScope:
     """Test suite for Scope"""
@@ -105,6 +112,26 @@ class TestScope:
         assert parent_symbol.scope_id != child_symbol.scope_id
         assert child.lookup("x") is child_symbol
 
+    def test_define_interns_name(self):
+        """Test defined names are interned"""
+        import sys
+        scope = Scope()
+        name = "".join(["dyn", "amic_name"])
+        symbol = scope.define(name)
+        assert symbol.name is sys.intern("dynamic_name")
+        assert next(iter(scope.symbols)) is symbol.name
+
+    def test_lookup_deeper_than_recursion_limit(self):
+        """Test lookup walks parents iteratively"""
+        import sys
+        root = Scope()
+        symbol = root.define("x")
+        scope = root
+        for _ in range(sys.getrecursionlimit() + 10):
+            scope = Scope(scope)
+        assert scope.lookup("x") is symbol
+        assert scope.lookup("missing") is None
+
     def test_get_depth_nested(self):
         """Test depth calculation for nested scopes"""
         root = Scope()
@@ -202,6 +202,32 @@ class TestSymbolTable:
         table.clear()
         assert len(table.get_all_symbols()) == 0
 
+    def test_clear_empties_scope_index(self):
+        """Test clear also forgets per-scope symbols"""
+        manager = ScopeManager()
+        table = SymbolTable(manager)
+        scope_id = table.add_local("x").scope_id
+
+        table.clear()
+        assert table.get_symbols_in_scope(scope_id) == []
+
+    def test_kind_buckets_are_copies_and_cleared(self):
+        """Test kind queries return fresh lists and clear empties them"""
+        manager = ScopeManager()
+        table = SymbolTable(manager)
+        table.add_function("f", is_global=True)
+        table.add_local("x")
+
+        table.get_global_symbols().clear()
+        assert [s.name for s in table.get_global_symbols()] == ["f"]
+        assert [s.name for s in table.get_function_symbols()] == ["f"]
+        assert [s.name for s in table.get_local_symbols()] == ["x"]
+
+        table.clear()
+        assert table.get_global_symbols() == []
+        assert table.get_function_symbols() == []
+        assert table.get_local_symbols() == []
+
     def test_nested_scopes(self):
         """Test symbols across nested scopes"""
         manager = ScopeManager()
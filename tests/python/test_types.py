@@ -4,16 +4,19 @@ Tests for TypeKind enum, Type dataclass, and ASTAnnotationStore.
 """
 
 import pytest
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
+from luaparser import astnodes
+
+from lua2cpp.core.types import ASTAnnotationStore, TableTypeInfo, Type, TypeKind
+
 
 class TestTypeKind:
     """Test TypeKind enum"""
 
     def test_enum_values_exist(self):
         """Test that all required TypeKind values exist"""
-        from lua2cpp.core.types import TypeKind
-
         assert hasattr(TypeKind, 'UNKNOWN')
         assert hasattr(TypeKind, 'STRING')
         assert hasattr(TypeKind, 'NUMBER')
@@ -24,20 +27,14 @@ class TestTypeKind:
 
     def test_no_nil_type(self):
         """Test that NIL is NOT a separate TypeKind (handled via ANY)"""
-        from lua2cpp.core.types import TypeKind
-
         assert not hasattr(TypeKind, 'NIL')
 
     def test_no_array_type(self):
         """Test that ARRAY is NOT a separate TypeKind"""
-        from lua2cpp.core.types import TypeKind
-
         assert not hasattr(TypeKind, 'ARRAY')
 
     def test_enum_values_are_ints(self):
         """Test that TypeKind values are integers"""
-        from lua2cpp.core.types import TypeKind
-
         assert TypeKind.UNKNOWN.value == 0
         assert TypeKind.STRING.value == 1
         assert TypeKind.NUMBER.value == 2
@@ -52,33 +49,53 @@ class TestType:
 
     def test_type_has_required_fields(self):
         """Test that Type has kind, is_constant, subtypes fields"""
-        from lua2cpp.core.types import Type, TypeKind
-
         t = Type(kind=TypeKind.STRING)
         assert hasattr(t, 'kind')
         assert hasattr(t, 'is_constant')
         assert hasattr(t, 'subtypes')
+        assert '__slots__' in Type.__dict__
+
+    def test_type_is_frozen(self):
+        """Test that Type instances cannot be mutated"""
+        t = Type(kind=TypeKind.NUMBER)
+
+        with pytest.raises(FrozenInstanceError):
+            t.kind = TypeKind.STRING
+        with pytest.raises(AttributeError):
+            t.subtypes.append(Type(kind=TypeKind.STRING))
+
+    def test_type_of_returns_shared_instance(self):
+        """Test Type.of() pools plain types per kind"""
+        t = Type.of(TypeKind.NUMBER)
+        assert t is Type.of(TypeKind.NUMBER)
+        assert t == Type(TypeKind.NUMBER)
+        assert Type.of(TypeKind.STRING) is not t
+
+    def test_kind_mask(self):
+        """Test kind_mask sets one bit per kind and unions subtypes"""
+        assert Type(TypeKind.NUMBER).kind_mask() == 1 << TypeKind.NUMBER.value
+        variant = Type(TypeKind.ANY, subtypes=(Type(TypeKind.NUMBER), Type(TypeKind.STRING)))
+        assert variant.kind_mask() == (1 << TypeKind.NUMBER.value) | (1 << TypeKind.STRING.value)
+        assert Type.any_of_mask(variant.kind_mask()) == Type(
+            TypeKind.ANY, subtypes=(Type(TypeKind.STRING), Type(TypeKind.NUMBER)))
+        assert Type.any_of_mask(variant.kind_mask()) is Type.any_of_mask(variant.kind_mask())
+        # Interned ANY types are shared by every merge with the same mask
+        assert isinstance(Type.any_of_mask(variant.kind_mask()).subtypes, tuple)
 
     def test_type_initialization(self):
         """Test Type initialization with defaults"""
-        from lua2cpp.core.types import Type, TypeKind
-
         t = Type(kind=TypeKind.NUMBER)
         assert t.kind == TypeKind.NUMBER
         assert t.is_constant is False
-        assert t.subtypes == []
+        assert t.subtypes == ()
 
     def test_cpp_type_method_exists(self):
         """Test that Type has cpp_type() method"""
-        from lua2cpp.core.types import Type, TypeKind
-
         t = Type(kind=TypeKind.STRING)
         assert callable(t.cpp_type)
 
     def test_cpp_type_returns_correct_values(self):
         """Test cpp_type() returns correct C++ type names"""
-        from lua2cpp.core.types import Type, TypeKind
-
         tests = [
             (TypeKind.UNKNOWN, 'auto'),
             (TypeKind.STRING, 'STRING'),
@@ -94,14 +111,21 @@ class TestType:
             assert t.cpp_type() == expected
 
 
+class TestTableTypeInfo:
+    """Test TableTypeInfo dataclass"""
+
+    def test_table_type_info_has_slots(self):
+        """Test that TableTypeInfo instances carry no __dict__"""
+        info = TableTypeInfo(is_array=True, value_type=Type.of(TypeKind.NUMBER))
+        assert not hasattr(info, '__dict__')
+        assert info.value_type.kind == TypeKind.NUMBER
+
+
 class TestASTAnnotationStore:
     """Test ASTAnnotationStore"""
 
     def test_set_and_get_type(self):
         """Test setting and getting type annotations"""
-        from lua2cpp.core.types import ASTAnnotationStore, Type, TypeKind
-        from luaparser import astnodes
-
         node = astnodes.Number(42)
         t = Type(kind=TypeKind.NUMBER)
 
@@ -113,9 +137,6 @@ class TestASTAnnotationStore:
 
     def test_set_and_get_annotation(self):
         """Test setting and getting custom annotations"""
-        from lua2cpp.core.types import ASTAnnotationStore
-        from luaparser import astnodes
-
         node = astnodes.Name('x')
         ASTAnnotationStore.set_annotation(node, 'custom_key', 'custom_value')
         retrieved = ASTAnnotationStore.get_annotation(node, 'custom_key')
@@ -124,9 +145,6 @@ class TestASTAnnotationStore:
 
     def test_has_annotation(self):
         """Test has_annotation returns correct boolean"""
-        from lua2cpp.core.types import ASTAnnotationStore
-        from luaparser import astnodes
-
         node = astnodes.Name('y')
         assert not ASTAnnotationStore.has_annotation(node, 'nonexistent')
 
@@ -135,9 +153,6 @@ class TestASTAnnotationStore:
 
     def test_private_namespace(self):
         """Test that annotations use _l2c_ prefix"""
-        from lua2cpp.core.types import ASTAnnotationStore
-        from luaparser import astnodes
-
         node = astnodes.Name('z')
 
         # Set an annotation